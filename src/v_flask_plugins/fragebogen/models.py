@@ -34,12 +34,12 @@ from __future__ import annotations
 import secrets
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from v_flask.extensions import db
 
 if TYPE_CHECKING:
-    pass
+    from jinja2 import Template
 
 
 class FragebogenStatus(Enum):
@@ -137,25 +137,56 @@ class Fragebogen(db.Model):
             return self.definition_json.get('seiten', [])
         return []
 
+    def cached_from_definition(self, key: str, build: Callable[[], Any]) -> Any:
+        """Cache a value derived from definition_json on this instance.
+
+        All cached values are dropped as soon as definition_json is
+        replaced (assignment or reload from the database).
+
+        Args:
+            key: Name of the derived value.
+            build: Callable computing the value on a cache miss.
+
+        Returns:
+            The cached or freshly built value.
+        """
+        definition = self.definition_json
+        cache = self.__dict__.get('_definition_cache')
+        if cache is None or cache[0] is not definition:
+            cache = (definition, {})
+            self._definition_cache = cache
+
+        values = cache[1]
+        if key not in values:
+            values[key] = build()
+        return values[key]
+
     @property
     def fragen(self) -> list:
-        """Get all questions from all pages."""
-        if not self.definition_json:
+        """Get all questions from all pages (cached per definition)."""
+        return self.cached_from_definition('fragen', self._build_fragen)
+
+    def _build_fragen(self) -> list:
+        definition = self.definition_json
+        if not definition:
             return []
 
         if self.is_v2:
             alle_fragen = []
-            for seite in self.definition_json.get('seiten', []):
+            for seite in definition.get('seiten', []):
                 alle_fragen.extend(seite.get('fragen', []))
             return alle_fragen
 
         # Fallback for V1 (flat list)
-        return self.definition_json.get('fragen', [])
+        return definition.get('fragen', [])
 
     @property
     def fragen_mit_prefill(self) -> list:
-        """Get all questions that have prefill configured."""
-        return [f for f in self.fragen if f.get('prefill')]
+        """Get all questions that have prefill configured (cached per definition)."""
+        return self.cached_from_definition(
+            'fragen_mit_prefill',
+            lambda: [f for f in self.fragen if f.get('prefill')]
+        )
 
     @property
     def anzahl_fragen(self) -> int:
@@ -606,9 +637,17 @@ class FragebogenAntwort(db.Model):
         Returns:
             The value (for single-value types) or list of values (for multi-select).
         """
-        if not self.antwort_json:
+        return self.extract_value(self.antwort_json)
+
+    @staticmethod
+    def extract_value(antwort_json: dict | None):
+        """Get the primary value from raw answer JSON.
+
+        Same as the value property, for callers that only loaded the column.
+        """
+        if not antwort_json:
             return None
-        return self.antwort_json.get('value') or self.antwort_json.get('values')
+        return antwort_json.get('value') or antwort_json.get('values')
 
     @property
     def freitext(self) -> str | None:
@@ -748,6 +787,53 @@ class ParticipantSourceConfig(db.Model):
         """
         return self.model_path.split('.')[-1].lower()
 
+    @property
+    def compiled_greeting(self) -> 'Template | None':
+        """Get the compiled greeting template (cached per template text).
+
+        Raises:
+            jinja2.TemplateSyntaxError: If the template is invalid.
+        """
+        template = self.greeting_template
+        cache = self.__dict__.get('_greeting_cache')
+        if cache is None or cache[0] is not template:
+            compiled = None
+            if template:
+                from v_flask_plugins.fragebogen.services.participant_source import (
+                    _compile_greeting
+                )
+                compiled = _compile_greeting(template)
+            cache = (template, compiled)
+            self._greeting_cache = cache
+        return cache[1]
+
+    @property
+    def compiled_field_getters(self) -> dict:
+        """Get the field_mapping compiled into getters (cached per mapping).
+
+        Returns:
+            Dict mapping each field_mapping key to a callable that takes a
+            model instance and returns the value as string (or None).
+            Unsupported specifications are omitted.
+        """
+        # Read the loaded value directly; the instrumented attribute access
+        # would cost more than the getters save (falls back when expired)
+        state = self.__dict__
+        mapping = state['field_mapping'] if 'field_mapping' in state else self.field_mapping
+        cache = state.get('_field_getter_cache')
+        if cache is None or cache[0] is not mapping:
+            from v_flask_plugins.fragebogen.services.participant_source import (
+                compile_field_spec
+            )
+            getters = {}
+            for key, field_spec in (mapping or {}).items():
+                getter = compile_field_spec(field_spec) if field_spec else None
+                if getter is not None:
+                    getters[key] = getter
+            cache = (mapping, getters)
+            self._field_getter_cache = cache
+        return cache[1]
+
     def validate_field_mapping(self) -> list[str]:
         """Validate that field mapping contains required fields.
 
@@ -56,16 +56,18 @@ def wizard(token: str):
     if teilnahme.is_abgeschlossen:
         return redirect(url_for('fragebogen_public.danke', token=token))
 
+    # Prefill values for the snapshot and the form (one resolver walk)
+    prefill_values, initial = service.get_prefill_data(fragebogen, teilnahme)
+
     # Start participation if not started
     if teilnahme.is_eingeladen:
-        teilnahme.starten()
+        service.start_teilnahme(teilnahme, prefill_values)
         db.session.commit()
 
     # Get existing answers
     antworten = {a.frage_id: a.antwort_json for a in teilnahme.antworten}
 
-    # Get initial/prefill values for unanswered questions
-    initial = service.get_initial_antworten(fragebogen, teilnahme)
+    # Use initial/prefill values for unanswered questions
     for frage_id, value in initial.items():
         if frage_id not in antworten:
             antworten[frage_id] = value
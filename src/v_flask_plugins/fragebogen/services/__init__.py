@@ -15,6 +15,7 @@ from v_flask_plugins.fragebogen.services.participant_source import (
     reset_dynamic_participant_resolver,
     load_model_class,
     get_field_value,
+    compile_field_spec,
     generate_greeting,
     ModelLoadError,
     FieldMappingError,
@@ -50,6 +51,7 @@ __all__ = [
     # Participant source helpers
     'load_model_class',
     'get_field_value',
+    'compile_field_spec',
     'generate_greeting',
     'ModelLoadError',
     'FieldMappingError',
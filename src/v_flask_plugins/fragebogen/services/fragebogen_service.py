@@ -11,22 +11,32 @@ Handles:
 
 from __future__ import annotations
 
-import copy
+import functools
+import json
 from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable
+
+from flask import current_app, url_for
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
 
 from v_flask.extensions import db
+from v_flask.services import get_email_service
 from v_flask_plugins.fragebogen.models import (
     Fragebogen,
     FragebogenAntwort,
     FragebogenStatus,
     FragebogenTeilnahme,
+    TeilnahmeStatus,
 )
 
 if TYPE_CHECKING:
-    pass
+    from sqlalchemy import Insert
 
 
 # Valid question types (V2 schema)
@@ -44,8 +54,143 @@ VALID_FRAGE_TYPEN = [
     'table',
 ]
 
+# show_if operators mapped to a predicate factory (frage_id, operand).
+# Checked in this order; the first operator present in show_if wins.
+SHOW_IF_OPERATORS = {
+    'equals': lambda ref, operand: lambda antworten: antworten.get(ref) == operand,
+    'not_equals': lambda ref, operand: lambda antworten: antworten.get(ref) != operand,
+    'is_set': lambda ref, operand: lambda antworten: antworten.get(ref) not in (None, ''),
+    'is_not_set': lambda ref, operand: lambda antworten: antworten.get(ref) in (None, ''),
+}
+
 # Valid show_if operators
-VALID_SHOW_IF_OPERATORS = ['equals', 'not_equals', 'is_set', 'is_not_set']
+VALID_SHOW_IF_OPERATORS = list(SHOW_IF_OPERATORS)
+
+# Compiled show_if condition: answers by frage_id -> visible
+VisibilityCheck = Callable[[dict[str, Any]], bool]
+
+
+def _always_visible(antworten: dict[str, Any]) -> bool:
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_show_if_predicate(ref_frage_id: str, operator: str, operand: Any) -> VisibilityCheck:
+    """Share one predicate between identical (hashable) conditions."""
+    return SHOW_IF_OPERATORS[operator](ref_frage_id, operand)
+
+
+def compile_show_if(show_if: dict[str, Any] | None) -> VisibilityCheck:
+    """Compile a show_if condition into a predicate over the answer map.
+
+    Args:
+        show_if: The show_if condition of a question (or None).
+
+    Returns:
+        Callable taking the answers (frage_id -> value) and returning
+        whether the question is visible.
+    """
+    if not show_if:
+        return _always_visible
+
+    ref_frage_id = show_if.get('frage_id')
+    if not ref_frage_id:
+        return _always_visible
+
+    for operator in SHOW_IF_OPERATORS:
+        if operator in show_if:
+            operand = show_if[operator]
+            try:
+                return _cached_show_if_predicate(ref_frage_id, operator, operand)
+            except TypeError:
+                # Unhashable operand (e.g. a list) - compile without caching
+                return SHOW_IF_OPERATORS[operator](ref_frage_id, operand)
+
+    return _always_visible
+
+
+def get_visibility_checks(fragebogen: Fragebogen) -> dict[str, VisibilityCheck]:
+    """Get compiled show_if predicates for all questions of a Fragebogen.
+
+    The result is cached on the instance and recompiled when
+    definition_json is replaced (e.g. after an update or a reload).
+
+    Args:
+        fragebogen: The Fragebogen.
+
+    Returns:
+        Dict mapping frage_id to its visibility predicate.
+    """
+    return fragebogen.cached_from_definition('visibility_checks', lambda: {
+        frage['id']: compile_show_if(frage.get('show_if'))
+        for frage in fragebogen.fragen
+        if 'id' in frage
+    })
+
+
+# Dialects supporting INSERT ... ON CONFLICT DO UPDATE (answer upsert)
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+# =============================================================================
+# Type-specific Validators
+# =============================================================================
+
+def _validate_choice(frage: dict[str, Any]) -> Iterator[str]:
+    """Validate single_choice, multiple_choice and dropdown questions."""
+    if 'optionen' not in frage:
+        yield f'Feld "optionen" fehlt für {frage["typ"]}'
+    elif not isinstance(frage['optionen'], list) or len(frage['optionen']) < 2:
+        yield 'Mindestens 2 Optionen erforderlich'
+
+
+def _validate_skala(frage: dict[str, Any]) -> Iterator[str]:
+    """Validate skala questions."""
+    if 'min' not in frage or 'max' not in frage:
+        yield 'Felder "min" und "max" erforderlich'
+    elif not isinstance(frage.get('min'), int) or not isinstance(frage.get('max'), int):
+        yield '"min" und "max" müssen Zahlen sein'
+    elif frage['min'] >= frage['max']:
+        yield '"min" muss kleiner als "max" sein'
+
+
+def _validate_number(frage: dict[str, Any]) -> Iterator[str]:
+    """Validate number questions."""
+    if 'min' in frage and not isinstance(frage['min'], (int, float)):
+        yield '"min" muss eine Zahl sein'
+    if 'max' in frage and not isinstance(frage['max'], (int, float)):
+        yield '"max" muss eine Zahl sein'
+
+
+def _validate_group(frage: dict[str, Any]) -> Iterator[str]:
+    """Validate group questions."""
+    if 'fields' not in frage:
+        yield 'Feld "fields" fehlt für group'
+    elif not isinstance(frage['fields'], list) or len(frage['fields']) == 0:
+        yield 'Mindestens ein Feld in "fields" erforderlich'
+
+
+def _validate_table(frage: dict[str, Any]) -> Iterator[str]:
+    """Validate table questions."""
+    if 'columns' not in frage:
+        yield 'Feld "columns" fehlt für table'
+    elif not isinstance(frage['columns'], list) or len(frage['columns']) == 0:
+        yield 'Mindestens eine Spalte erforderlich'
+
+
+# Question type -> validator for its type-specific fields
+_TYPE_VALIDATORS = {
+    'single_choice': _validate_choice,
+    'multiple_choice': _validate_choice,
+    'dropdown': _validate_choice,
+    'skala': _validate_skala,
+    'number': _validate_number,
+    'group': _validate_group,
+    'table': _validate_table,
+}
 
 
 @dataclass
@@ -64,6 +209,26 @@ class EinladungResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _coerce_skala_value(answer: Any) -> int | None:
+    """Coerce a skala answer to int (None if not an integral number).
+
+    Accepts ints, integral floats and integer strings (including negative
+    values); booleans are not scale values.
+    """
+    if isinstance(answer, bool):
+        return None
+    if isinstance(answer, int):
+        return answer
+    if isinstance(answer, float):
+        return int(answer) if answer.is_integer() else None
+    if isinstance(answer, str):
+        try:
+            return int(answer)
+        except ValueError:
+            return None
+    return None
+
+
 class TeilnehmerResolver(ABC):
     """Abstract interface for resolving participant data.
 
@@ -109,6 +274,45 @@ class TeilnehmerResolver(ABC):
         """
         return None
 
+    def get_prefill_values(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        prefill_keys: list[str]
+    ) -> dict[str, Any]:
+        """Get prefill values for several fields at once.
+
+        Defaults to one get_prefill_value() call per key. Override when
+        the participant can be loaded once for all keys.
+        """
+        return {
+            key: self.get_prefill_value(teilnehmer_id, teilnehmer_typ, key)
+            for key in prefill_keys
+        }
+
+    def preload_teilnehmer(
+        self,
+        teilnahmen: list[FragebogenTeilnahme],
+        extra_fields: tuple[str, ...] = ()
+    ) -> dict[tuple[str, int], Any]:
+        """Batch-load the participants of several participations.
+
+        Called before per-participant lookups in a loop. The loaded objects
+        only stay in the session's identity map while referenced, so callers
+        keep the returned dict in a local until the loop is done; the
+        per-participant lookups then need no query. Defaults to loading
+        nothing.
+
+        Args:
+            teilnahmen: The participations whose participants are needed.
+            extra_fields: Model fields read beyond the standard lookups
+                (e.g. the fields named in prefill keys).
+
+        Returns:
+            Dict mapping (teilnehmer_typ, teilnehmer_id) to the loaded object.
+        """
+        return {}
+
 
 class NullTeilnehmerResolver(TeilnehmerResolver):
     """Null implementation that returns None for all lookups."""
@@ -120,6 +324,10 @@ class NullTeilnehmerResolver(TeilnehmerResolver):
         return None
 
 
+# Stateless, so one instance is shared by all services
+_NULL_RESOLVER = NullTeilnehmerResolver()
+
+
 class DynamicTeilnehmerResolverAdapter(TeilnehmerResolver):
     """Adapter that wraps DynamicParticipantResolver to TeilnehmerResolver interface.
 
@@ -162,6 +370,37 @@ class DynamicTeilnehmerResolverAdapter(TeilnehmerResolver):
             teilnehmer_id, teilnehmer_typ, prefill_key
         )
 
+    def get_prefill_values(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        prefill_keys: list[str]
+    ) -> dict[str, Any]:
+        """Get several prefill values via dynamic resolver (one instance load)."""
+        return self._get_resolver().get_prefill_values(
+            teilnehmer_id, teilnehmer_typ, prefill_keys
+        )
+
+    def preload_teilnehmer(
+        self,
+        teilnahmen: list[FragebogenTeilnahme],
+        extra_fields: tuple[str, ...] = ()
+    ) -> dict[tuple[str, int], Any]:
+        """Load participants with one query per participant type."""
+        ids_by_typ: defaultdict[str, list[int]] = defaultdict(list)
+        for teilnahme in teilnahmen:
+            if teilnahme.teilnehmer_id is not None:
+                ids_by_typ[teilnahme.teilnehmer_typ].append(teilnahme.teilnehmer_id)
+
+        resolver = self._get_resolver()
+        return {
+            (typ, teilnehmer_id): instance
+            for typ, ids in ids_by_typ.items()
+            for teilnehmer_id, instance in resolver.get_instances(
+                ids, typ, extra_fields
+            ).items()
+        }
+
     def get_greeting(self, teilnehmer_id: int, teilnehmer_typ: str) -> str | None:
         """Get personalized greeting via dynamic resolver.
 
@@ -184,7 +423,7 @@ class FragebogenService:
             teilnehmer_resolver: Optional resolver for participant data.
                                  Defaults to NullTeilnehmerResolver.
         """
-        self._teilnehmer_resolver = teilnehmer_resolver or NullTeilnehmerResolver()
+        self._teilnehmer_resolver = teilnehmer_resolver or _NULL_RESOLVER
 
     def set_teilnehmer_resolver(self, resolver: TeilnehmerResolver) -> None:
         """Set the participant resolver.
@@ -252,34 +491,34 @@ class FragebogenService:
         seen_seiten_ids: set[str] = set()
         total_fragen = 0
 
+        # Messages are prefixed with their position only when an error occurs
         for si, seite in enumerate(seiten):
-            seite_prefix = f'Seite {si + 1}'
-
             if not isinstance(seite, dict):
-                errors.append(f'{seite_prefix}: Muss ein Objekt sein')
+                errors.append(f'Seite {si + 1}: Muss ein Objekt sein')
                 continue
 
             # Validate seite fields
             if 'id' not in seite:
-                errors.append(f'{seite_prefix}: Feld "id" fehlt')
+                errors.append(f'Seite {si + 1}: Feld "id" fehlt')
             elif seite['id'] in seen_seiten_ids:
-                errors.append(f'{seite_prefix}: ID "{seite["id"]}" ist doppelt')
+                errors.append(f'Seite {si + 1}: ID "{seite["id"]}" ist doppelt')
             else:
                 seen_seiten_ids.add(seite['id'])
 
             if 'titel' not in seite:
-                errors.append(f'{seite_prefix}: Feld "titel" fehlt')
+                errors.append(f'Seite {si + 1}: Feld "titel" fehlt')
 
             # Validate fragen within seite
             fragen = seite.get('fragen', [])
             if not isinstance(fragen, list):
-                errors.append(f'{seite_prefix}: "fragen" muss eine Liste sein')
+                errors.append(f'Seite {si + 1}: "fragen" muss eine Liste sein')
                 continue
 
             for fi, frage in enumerate(fragen):
-                frage_prefix = f'{seite_prefix}, Frage {fi + 1}'
-                frage_errors = self._validate_frage(frage, frage_prefix, seen_ids)
-                errors.extend(frage_errors)
+                errors.extend(
+                    f'Seite {si + 1}, Frage {fi + 1}: {error}'
+                    for error in self._validate_frage(frage, seen_ids)
+                )
                 total_fragen += 1
 
         if total_fragen == 0:
@@ -290,106 +529,69 @@ class FragebogenService:
     def _validate_frage(
         self,
         frage: dict[str, Any],
-        prefix: str,
         seen_ids: set[str]
-    ) -> list[str]:
-        """Validate a single question."""
-        errors = []
+    ) -> Iterator[str]:
+        """Validate a single question.
 
+        Yields error messages without the position prefix.
+        """
         if not isinstance(frage, dict):
-            return [f'{prefix}: Muss ein Objekt sein']
+            yield 'Muss ein Objekt sein'
+            return
 
         # Required fields
         if 'id' not in frage:
-            errors.append(f'{prefix}: Feld "id" fehlt')
+            yield 'Feld "id" fehlt'
         elif frage['id'] in seen_ids:
-            errors.append(f'{prefix}: ID "{frage["id"]}" ist doppelt')
+            yield f'ID "{frage["id"]}" ist doppelt'
         else:
             seen_ids.add(frage['id'])
 
         if 'typ' not in frage:
-            errors.append(f'{prefix}: Feld "typ" fehlt')
+            yield 'Feld "typ" fehlt'
         elif frage['typ'] not in VALID_FRAGE_TYPEN:
-            errors.append(f'{prefix}: Ungültiger Typ "{frage["typ"]}"')
+            yield f'Ungültiger Typ "{frage["typ"]}"'
 
         typ = frage.get('typ')
 
         # "frage" field is optional for group type
         if typ != 'group' and 'frage' not in frage:
-            errors.append(f'{prefix}: Feld "frage" (Fragetext) fehlt')
+            yield 'Feld "frage" (Fragetext) fehlt'
 
         # Type-specific validation
-        errors.extend(self._validate_frage_type_specific(frage, prefix, typ))
+        yield from self._validate_frage_type_specific(frage, typ)
 
         # show_if validation
         if 'show_if' in frage:
-            errors.extend(self._validate_show_if(frage['show_if'], prefix))
-
-        return errors
+            yield from self._validate_show_if(frage['show_if'])
 
     def _validate_frage_type_specific(
         self,
         frage: dict[str, Any],
-        prefix: str,
         typ: str | None
-    ) -> list[str]:
+    ) -> Iterator[str]:
         """Validate type-specific fields."""
-        errors = []
+        validator = _TYPE_VALIDATORS.get(typ)
+        if validator:
+            yield from validator(frage)
 
-        if typ in ['single_choice', 'multiple_choice', 'dropdown']:
-            if 'optionen' not in frage:
-                errors.append(f'{prefix}: Feld "optionen" fehlt für {typ}')
-            elif not isinstance(frage['optionen'], list) or len(frage['optionen']) < 2:
-                errors.append(f'{prefix}: Mindestens 2 Optionen erforderlich')
-
-        elif typ == 'skala':
-            if 'min' not in frage or 'max' not in frage:
-                errors.append(f'{prefix}: Felder "min" und "max" erforderlich')
-            elif not isinstance(frage.get('min'), int) or not isinstance(frage.get('max'), int):
-                errors.append(f'{prefix}: "min" und "max" müssen Zahlen sein')
-            elif frage['min'] >= frage['max']:
-                errors.append(f'{prefix}: "min" muss kleiner als "max" sein')
-
-        elif typ == 'number':
-            if 'min' in frage and not isinstance(frage['min'], (int, float)):
-                errors.append(f'{prefix}: "min" muss eine Zahl sein')
-            if 'max' in frage and not isinstance(frage['max'], (int, float)):
-                errors.append(f'{prefix}: "max" muss eine Zahl sein')
-
-        elif typ == 'group':
-            if 'fields' not in frage:
-                errors.append(f'{prefix}: Feld "fields" fehlt für group')
-            elif not isinstance(frage['fields'], list) or len(frage['fields']) == 0:
-                errors.append(f'{prefix}: Mindestens ein Feld in "fields" erforderlich')
-
-        elif typ == 'table':
-            if 'columns' not in frage:
-                errors.append(f'{prefix}: Feld "columns" fehlt für table')
-            elif not isinstance(frage['columns'], list) or len(frage['columns']) == 0:
-                errors.append(f'{prefix}: Mindestens eine Spalte erforderlich')
-
-        return errors
-
-    def _validate_show_if(self, show_if: Any, prefix: str) -> list[str]:
+    def _validate_show_if(self, show_if: Any) -> Iterator[str]:
         """Validate show_if condition."""
-        errors = []
-
         if not isinstance(show_if, dict):
-            return [f'{prefix}: "show_if" muss ein Objekt sein']
+            yield '"show_if" muss ein Objekt sein'
+            return
 
         if 'frage_id' not in show_if:
-            errors.append(f'{prefix}: "show_if.frage_id" fehlt')
+            yield '"show_if.frage_id" fehlt'
 
         # Check for valid operator
         has_operator = any(op in show_if for op in VALID_SHOW_IF_OPERATORS)
         if not has_operator:
-            errors.append(
-                f'{prefix}: "show_if" braucht einen Operator '
-                f'(equals, not_equals, is_set, is_not_set)'
+            yield (
+                '"show_if" braucht einen Operator '
+                '(equals, not_equals, is_set, is_not_set)'
             )
 
-        return errors
-
     # =========================================================================
     # CRUD Operations
     # =========================================================================
@@ -501,7 +703,8 @@ class FragebogenService:
             )
 
         titel = new_titel or fragebogen.titel
-        definition_copy = copy.deepcopy(fragebogen.definition_json)
+        # JSON round-trip is a much cheaper deep copy for JSON-shaped data
+        definition_copy = json.loads(json.dumps(fragebogen.definition_json))
 
         new_fragebogen = Fragebogen(
             titel=titel,
@@ -549,12 +752,13 @@ class FragebogenService:
                 f'{teilnehmer_typ}:{teilnehmer_id}: Keine E-Mail-Adresse hinterlegt'
             )
 
-        # Check if already exists
-        existing = db.session.query(FragebogenTeilnahme).filter_by(
-            fragebogen_id=fragebogen.id,
-            teilnehmer_id=teilnehmer_id,
-            teilnehmer_typ=teilnehmer_typ
-        ).first()
+        # Check if already exists (read-only, no need to flush pending changes)
+        with db.session.no_autoflush:
+            existing = db.session.query(FragebogenTeilnahme).filter_by(
+                fragebogen_id=fragebogen.id,
+                teilnehmer_id=teilnehmer_id,
+                teilnehmer_typ=teilnehmer_typ
+            ).first()
 
         if existing:
             raise ValueError(f'{teilnehmer_typ}:{teilnehmer_id} ist bereits Teilnehmer')
@@ -638,10 +842,6 @@ class FragebogenService:
         Returns:
             EinladungResult with counts.
         """
-        from flask import current_app, url_for
-
-        from v_flask.services import get_email_service
-
         if not fragebogen.is_aktiv:
             return EinladungResult(
                 success=False,
@@ -669,6 +869,13 @@ class FragebogenService:
                 errors=['Keine Teilnehmer zum Einladen gefunden']
             )
 
+        magic_url_base = self._get_magic_url_base()
+        # Load all participants up front (held while looping, see
+        # TeilnehmerResolver.preload_teilnehmer)
+        preloaded = self._teilnehmer_resolver.preload_teilnehmer(teilnahmen)  # noqa: F841
+        # One timestamp for the whole batch
+        gesendet_am = datetime.utcnow()
+
         sent_count = 0
         failed_count = 0
         errors = []
@@ -692,17 +899,7 @@ class FragebogenService:
                 failed_count += 1
                 continue
 
-            # Generate magic URL
-            try:
-                magic_url = url_for(
-                    'fragebogen_public.wizard',
-                    token=teilnahme.token,
-                    _external=True
-                )
-            except RuntimeError:
-                # Outside request context - use config
-                base_url = current_app.config.get('SERVER_NAME', 'localhost:5000')
-                magic_url = f"https://{base_url}/fragebogen/t/{teilnahme.token}"
+            magic_url = magic_url_base + teilnahme.token
 
             result = email_service.send_fragebogen_einladung(
                 to_email=to_email,
@@ -712,7 +909,7 @@ class FragebogenService:
             )
 
             if result.success:
-                teilnahme.einladung_gesendet_am = datetime.utcnow()
+                teilnahme.einladung_gesendet_am = gesendet_am
                 sent_count += 1
             else:
                 errors.append(
@@ -729,6 +926,24 @@ class FragebogenService:
             errors=errors if errors else []
         )
 
+    def _get_magic_url_base(self) -> str:
+        """Get the magic-link URL without the token.
+
+        Resolved once per batch; the token is appended per participant.
+        """
+        placeholder = '__token__'
+        try:
+            url = url_for(
+                'fragebogen_public.wizard',
+                token=placeholder,
+                _external=True
+            )
+            return url[:url.rindex(placeholder)]
+        except RuntimeError:
+            # Outside request context - use config
+            base_url = current_app.config.get('SERVER_NAME', 'localhost:5000')
+            return f"https://{base_url}/fragebogen/t/"
+
     # =========================================================================
     # Answer Management
     # =========================================================================
@@ -752,38 +967,76 @@ class FragebogenService:
         Raises:
             ValueError: If Fragebogen is not active or already completed.
         """
-        if not teilnahme.fragebogen.is_aktiv:
+        fragebogen = teilnahme.fragebogen
+        status = teilnahme.status
+
+        if not fragebogen.is_aktiv:
             raise ValueError('Fragebogen ist nicht mehr aktiv')
 
-        if teilnahme.is_abgeschlossen:
+        if status == TeilnahmeStatus.ABGESCHLOSSEN.value:
             raise ValueError('Teilnahme ist bereits abgeschlossen')
 
         # Start participation if not yet started
-        if teilnahme.is_eingeladen:
-            teilnahme.starten()
-            # Create prefill snapshot for change detection
-            if teilnahme.fragebogen.is_v2 and not teilnahme.prefill_snapshot_json:
-                self._create_prefill_snapshot(teilnahme)
-
-        # Check if answer exists
-        antwort = db.session.query(FragebogenAntwort).filter_by(
-            teilnahme_id=teilnahme.id,
-            frage_id=frage_id
-        ).first()
+        if status == TeilnahmeStatus.EINGELADEN.value:
+            self.start_teilnahme(teilnahme)
 
-        if antwort:
-            antwort.antwort_json = antwort_json
-        else:
-            antwort = FragebogenAntwort(
-                teilnahme_id=teilnahme.id,
-                frage_id=frage_id,
-                antwort_json=antwort_json
+        dialect_insert = _UPSERT_INSERTS.get(
+            db.session.get_bind(mapper=FragebogenAntwort).dialect.name
+        )
+        if dialect_insert is not None:
+            antwort = self._upsert_antwort(
+                dialect_insert, teilnahme, frage_id, antwort_json
             )
-            db.session.add(antwort)
+        else:
+            # Check if answer exists (read-only, no need to flush pending changes)
+            with db.session.no_autoflush:
+                antwort = db.session.query(FragebogenAntwort).filter_by(
+                    teilnahme_id=teilnahme.id,
+                    frage_id=frage_id
+                ).first()
+
+            if antwort:
+                antwort.antwort_json = antwort_json
+            else:
+                antwort = FragebogenAntwort(
+                    teilnahme_id=teilnahme.id,
+                    frage_id=frage_id,
+                    antwort_json=antwort_json
+                )
+                db.session.add(antwort)
 
         db.session.commit()
         return antwort
 
+    def _upsert_antwort(
+        self,
+        dialect_insert: Callable[..., Insert],
+        teilnahme: FragebogenTeilnahme,
+        frage_id: str,
+        antwort_json: dict[str, Any]
+    ) -> FragebogenAntwort:
+        """Insert or update an answer in a single statement.
+
+        Relies on the uq_teilnahme_frage constraint on (teilnahme_id, frage_id).
+        """
+        stmt = dialect_insert(FragebogenAntwort).values(
+            teilnahme_id=teilnahme.id,
+            frage_id=frage_id,
+            antwort_json=antwort_json
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['teilnahme_id', 'frage_id'],
+            set_={
+                'antwort_json': stmt.excluded.antwort_json,
+                'updated_at': datetime.utcnow(),
+            }
+        ).returning(FragebogenAntwort)
+
+        return db.session.scalars(
+            stmt,
+            execution_options={'populate_existing': True}
+        ).one()
+
     def save_kontakt_daten(
         self,
         teilnahme: FragebogenTeilnahme,
@@ -831,22 +1084,18 @@ class FragebogenService:
             if not teilnahme.kontakt_email or not teilnahme.kontakt_name:
                 raise ValueError('Kontaktdaten sind erforderlich')
 
-        # Build answer lookup for show_if evaluation
+        # Build answer lookup once; used for show_if and the required check
         antworten = {a.frage_id: a.value for a in teilnahme.antworten}
 
-        # Check required questions
-        missing = []
-        for frage in fragebogen.fragen:
-            if not frage.get('pflicht', False):
-                continue
-
-            # Check if question is visible (show_if condition met)
-            if not self._is_frage_visible(frage, antworten):
-                continue
-
-            antwort = teilnahme.get_antwort(frage['id'])
-            if not antwort or not antwort.value:
-                missing.append(frage.get('frage', frage['id']))
+        # Required questions that are visible (show_if met) but unanswered
+        checks = get_visibility_checks(fragebogen)
+        missing = [
+            frage.get('frage', frage['id'])
+            for frage in fragebogen.fragen
+            if frage.get('pflicht', False)
+            and checks.get(frage['id'], _always_visible)(antworten)
+            and not antworten.get(frage['id'])
+        ]
 
         if missing:
             raise ValueError(
@@ -857,35 +1106,20 @@ class FragebogenService:
         db.session.commit()
         return True
 
+    @staticmethod
     def _is_frage_visible(
-        self,
         frage: dict[str, Any],
         antworten: dict[str, Any]
     ) -> bool:
-        """Check if a question should be visible based on show_if condition."""
-        show_if = frage.get('show_if')
-        if not show_if:
-            return True
+        """Check if a question should be visible based on show_if condition.
 
-        ref_frage_id = show_if.get('frage_id')
-        if not ref_frage_id:
+        For repeated checks against one Fragebogen prefer the cached
+        predicates from get_visibility_checks().
+        """
+        # Most questions have no condition
+        if 'show_if' not in frage:
             return True
-
-        ref_value = antworten.get(ref_frage_id)
-
-        if 'equals' in show_if:
-            return ref_value == show_if['equals']
-
-        if 'not_equals' in show_if:
-            return ref_value != show_if['not_equals']
-
-        if 'is_set' in show_if:
-            return ref_value is not None and ref_value != ''
-
-        if 'is_not_set' in show_if:
-            return ref_value is None or ref_value == ''
-
-        return True
+        return compile_show_if(frage['show_if'])(antworten)
 
     # =========================================================================
     # Prefill
@@ -908,37 +1142,136 @@ class FragebogenService:
         Returns:
             Dict mapping prefill keys to their values.
         """
+        return self.get_prefill_data(fragebogen, teilnahme)[0]
+
+    def get_prefill_data(
+        self,
+        fragebogen: Fragebogen,
+        teilnahme: FragebogenTeilnahme
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """Resolve prefill values once for snapshot and form pre-population.
+
+        Args:
+            fragebogen: The Fragebogen.
+            teilnahme: The participation.
+
+        Returns:
+            Tuple of (prefill key -> value, frage_id -> initial answer dict).
+            The initial answers are only filled for V2 questionnaires.
+        """
         if teilnahme.is_anonym:
-            return {}
+            return {}, {}
 
-        prefill_values = {}
-        for frage in fragebogen.fragen_mit_prefill:
-            prefill_key = frage.get('prefill')
-            if not prefill_key:
-                continue
+        fragen = fragebogen.fragen_mit_prefill
+        if not fragen:
+            return {}, {}
 
-            value = self._teilnehmer_resolver.get_prefill_value(
-                teilnahme.teilnehmer_id,
-                teilnahme.teilnehmer_typ,
-                prefill_key
-            )
-            prefill_values[prefill_key] = value
+        prefill_values = self._teilnehmer_resolver.get_prefill_values(
+            teilnahme.teilnehmer_id,
+            teilnahme.teilnehmer_typ,
+            list(dict.fromkeys(frage['prefill'] for frage in fragen))
+        )
+
+        initial = {}
+        if fragebogen.is_v2:
+            for frage in fragen:
+                value = prefill_values.get(frage['prefill'])
+                if value is not None:
+                    initial[frage.get('id')] = {'value': value}
+
+        return prefill_values, initial
+
+    def start_teilnahme(
+        self,
+        teilnahme: FragebogenTeilnahme,
+        prefill_values: dict[str, Any] | None = None
+    ) -> None:
+        """Start a participation and snapshot its prefill values.
+
+        Committing is left to the caller.
+
+        Args:
+            teilnahme: The participation to start.
+            prefill_values: Prefill values already resolved via
+                get_prefill_data() (resolved here if not given).
+        """
+        teilnahme.starten()
+        # Create prefill snapshot for change detection
+        if teilnahme.fragebogen.is_v2 and not teilnahme.prefill_snapshot_json:
+            self._create_prefill_snapshot(teilnahme, prefill_values)
 
-        return prefill_values
+    def _create_prefill_snapshot(
+        self,
+        teilnahme: FragebogenTeilnahme,
+        prefill_values: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Create a snapshot of prefill values for change detection.
 
-    def _create_prefill_snapshot(self, teilnahme: FragebogenTeilnahme) -> dict[str, Any]:
-        """Create and save a snapshot of prefill values for change detection."""
+        The snapshot is only written if it differs from the stored one.
+        Committing is left to the caller, so the snapshot is saved in the
+        same transaction as the change that triggered it.
+        """
         fragebogen = teilnahme.fragebogen
 
         if not fragebogen.is_v2 or not fragebogen.fragen_mit_prefill:
             return {}
 
-        snapshot = self.get_prefill_values(fragebogen, teilnahme)
-        teilnahme.prefill_snapshot_json = snapshot
-        db.session.commit()
+        snapshot = prefill_values
+        if snapshot is None:
+            snapshot = self.get_prefill_values(fragebogen, teilnahme)
+        if teilnahme.prefill_snapshot_json != snapshot:
+            teilnahme.prefill_snapshot_json = snapshot
 
         return snapshot
 
+    def bulk_create_prefill_snapshots(
+        self,
+        fragebogen: Fragebogen,
+        teilnahmen: list[FragebogenTeilnahme] | None = None
+    ) -> int:
+        """Recreate the prefill snapshots of many participations at once.
+
+        Participants are preloaded per type and all changed snapshots are
+        saved with a single commit.
+
+        Args:
+            fragebogen: The Fragebogen.
+            teilnahmen: Participations to refresh (default: all non-anonymous).
+
+        Returns:
+            Number of snapshots that changed.
+        """
+        if not fragebogen.is_v2 or not fragebogen.fragen_mit_prefill:
+            return 0
+
+        if teilnahmen is None:
+            teilnahmen = [t for t in fragebogen.teilnahmen if not t.is_anonym]
+
+        # Preload participants including the columns named in the prefill
+        # keys, so resolving the prefill values below needs no lazy loads
+        prefill_fields = tuple(sorted({
+            frage['prefill'].split('.', 1)[1]
+            for frage in fragebogen.fragen_mit_prefill
+            if '.' in frage['prefill']
+        }))
+        # Held while looping, see TeilnehmerResolver.preload_teilnehmer
+        preloaded = self._teilnehmer_resolver.preload_teilnehmer(  # noqa: F841
+            teilnahmen, prefill_fields
+        )
+
+        changed = 0
+        for teilnahme in teilnahmen:
+            if teilnahme.is_anonym:
+                continue
+            snapshot = self.get_prefill_values(fragebogen, teilnahme)
+            if teilnahme.prefill_snapshot_json != snapshot:
+                teilnahme.prefill_snapshot_json = snapshot
+                changed += 1
+
+        if changed:
+            db.session.commit()
+        return changed
+
     def get_initial_antworten(
         self,
         fragebogen: Fragebogen,
@@ -953,24 +1286,9 @@ class FragebogenService:
         Returns:
             Dict mapping frage_id to answer dict.
         """
-        if not fragebogen.is_v2 or teilnahme.is_anonym:
+        if not fragebogen.is_v2:
             return {}
-
-        initial = {}
-        for frage in fragebogen.fragen_mit_prefill:
-            frage_id = frage.get('id')
-            prefill_key = frage.get('prefill')
-
-            if prefill_key:
-                value = self._teilnehmer_resolver.get_prefill_value(
-                    teilnahme.teilnehmer_id,
-                    teilnahme.teilnehmer_typ,
-                    prefill_key
-                )
-                if value is not None:
-                    initial[frage_id] = {'value': value}
-
-        return initial
+        return self.get_prefill_data(fragebogen, teilnahme)[1]
 
     # =========================================================================
     # Statistics
@@ -985,35 +1303,32 @@ class FragebogenService:
         Returns:
             Dict with statistics per question.
         """
+        teilnehmer_gesamt, teilnehmer_abgeschlossen = self._count_teilnahmen(fragebogen)
         auswertung = {
             'fragebogen_id': fragebogen.id,
             'titel': fragebogen.titel,
             'status': fragebogen.status,
-            'teilnehmer_gesamt': fragebogen.anzahl_teilnehmer,
-            'teilnehmer_abgeschlossen': fragebogen.anzahl_abgeschlossen,
+            'teilnehmer_gesamt': teilnehmer_gesamt,
+            'teilnehmer_abgeschlossen': teilnehmer_abgeschlossen,
             'fragen': []
         }
 
-        # Get all completed answers
-        abgeschlossene = [t for t in fragebogen.teilnahmen if t.is_abgeschlossen]
+        # Get all answers of completed participations in one query
+        fragen = fragebogen.fragen
+        answers_by_frage = self._get_abgeschlossene_antworten(
+            fragebogen, [frage['id'] for frage in fragen]
+        )
 
-        for frage in fragebogen.fragen:
+        for frage in fragen:
+            answers = answers_by_frage[frage['id']]
             frage_stats = {
                 'id': frage['id'],
                 'typ': frage['typ'],
                 'frage': frage.get('frage', frage['id']),
-                'antworten_count': 0,
+                'antworten_count': len(answers),
                 'statistik': {}
             }
 
-            # Collect answers for this question
-            answers = []
-            for teilnahme in abgeschlossene:
-                antwort = teilnahme.get_antwort(frage['id'])
-                if antwort and antwort.value is not None:
-                    answers.append(antwort.value)
-                    frage_stats['antworten_count'] += 1
-
             # Calculate statistics based on type
             frage_stats['statistik'] = self._calculate_frage_statistik(
                 frage['typ'], answers
@@ -1023,6 +1338,63 @@ class FragebogenService:
 
         return auswertung
 
+    def _count_teilnahmen(self, fragebogen: Fragebogen) -> tuple[int, int]:
+        """Count all and completed participations with one aggregate query.
+
+        Unlike anzahl_teilnehmer/anzahl_abgeschlossen this does not load
+        the teilnahmen relationship.
+
+        Returns:
+            Tuple of (total, completed).
+        """
+        gesamt, abgeschlossen = db.session.execute(
+            select(
+                func.count(FragebogenTeilnahme.id),
+                func.count(case(
+                    (FragebogenTeilnahme.status == TeilnahmeStatus.ABGESCHLOSSEN.value, 1)
+                ))
+            ).where(FragebogenTeilnahme.fragebogen_id == fragebogen.id)
+        ).one()
+        return gesamt, abgeschlossen
+
+    def _get_abgeschlossene_antworten(
+        self,
+        fragebogen: Fragebogen,
+        frage_ids: list[str]
+    ) -> dict[str, list[Any]]:
+        """Load answer values of all completed participations.
+
+        Answers to questions that are no longer part of the definition
+        are not loaded.
+
+        Args:
+            fragebogen: The Fragebogen.
+            frage_ids: IDs of the questions to collect answers for.
+
+        Returns:
+            Dict mapping each of frage_ids to its non-None answer values.
+        """
+        answers_by_frage: dict[str, list[Any]] = {frage_id: [] for frage_id in frage_ids}
+        if not answers_by_frage:
+            return answers_by_frage
+
+        rows = db.session.execute(
+            select(FragebogenAntwort.frage_id, FragebogenAntwort.antwort_json)
+            .join(FragebogenAntwort.teilnahme)
+            .where(
+                FragebogenTeilnahme.fragebogen_id == fragebogen.id,
+                FragebogenTeilnahme.status == TeilnahmeStatus.ABGESCHLOSSEN.value,
+                FragebogenAntwort.frage_id.in_(answers_by_frage)
+            )
+            .order_by(FragebogenTeilnahme.id)
+        )
+
+        for frage_id, antwort_json in rows:
+            value = FragebogenAntwort.extract_value(antwort_json)
+            if value is not None:
+                answers_by_frage[frage_id].append(value)
+        return answers_by_frage
+
     def _calculate_frage_statistik(
         self,
         typ: str,
@@ -1030,34 +1402,27 @@ class FragebogenService:
     ) -> dict[str, Any]:
         """Calculate statistics for a question based on its type."""
         if typ in ['single_choice', 'ja_nein', 'dropdown']:
-            counts = {}
-            for a in answers:
-                key = str(a)
-                counts[key] = counts.get(key, 0) + 1
-            return {'typ': 'verteilung', 'werte': counts}
+            counts = Counter(map(str, answers))
+            return {'typ': 'verteilung', 'werte': dict(counts)}
 
         elif typ == 'multiple_choice':
-            counts = {}
-            for a in answers:
-                if isinstance(a, list):
-                    for item in a:
-                        counts[item] = counts.get(item, 0) + 1
-            return {'typ': 'verteilung_mehrfach', 'werte': counts}
+            counts = Counter(chain.from_iterable(
+                a for a in answers if isinstance(a, list)
+            ))
+            return {'typ': 'verteilung_mehrfach', 'werte': dict(counts)}
 
         elif typ == 'skala':
-            if answers:
-                numeric = [
-                    int(a) for a in answers
-                    if isinstance(a, (int, float, str)) and str(a).isdigit()
-                ]
-                if numeric:
-                    return {
-                        'typ': 'skala',
-                        'durchschnitt': sum(numeric) / len(numeric),
-                        'min': min(numeric),
-                        'max': max(numeric),
-                        'verteilung': {str(v): numeric.count(v) for v in set(numeric)}
-                    }
+            # One counting pass; the rest only touches distinct values
+            verteilung = Counter(map(_coerce_skala_value, answers))
+            verteilung.pop(None, None)
+            if verteilung:
+                return {
+                    'typ': 'skala',
+                    'durchschnitt': sum(v * n for v, n in verteilung.items()) / verteilung.total(),
+                    'min': min(verteilung),
+                    'max': max(verteilung),
+                    'verteilung': {str(v): n for v, n in verteilung.items()}
+                }
             return {}
 
         elif typ == 'text':
@@ -1070,28 +1435,22 @@ class FragebogenService:
 # Singleton
 # =============================================================================
 
-_fragebogen_service: FragebogenService | None = None
-
-
+@functools.cache
 def get_fragebogen_service() -> FragebogenService:
     """Get the fragebogen service singleton.
 
     Automatically configures DynamicTeilnehmerResolverAdapter if
     ParticipantSourceConfig entries exist in the database.
     """
-    global _fragebogen_service
-    if _fragebogen_service is None:
-        _fragebogen_service = FragebogenService()
-
-        # Try to use dynamic resolver if configs exist
-        try:
-            from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
-            if ParticipantSourceConfig.get_all_active():
-                _fragebogen_service.set_teilnehmer_resolver(
-                    DynamicTeilnehmerResolverAdapter()
-                )
-        except Exception:
-            # Fallback to NullTeilnehmerResolver (default)
-            pass
-
-    return _fragebogen_service
+    service = FragebogenService()
+
+    # Try to use dynamic resolver if configs exist
+    try:
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+        if ParticipantSourceConfig.get_all_active():
+            service.set_teilnehmer_resolver(DynamicTeilnehmerResolverAdapter())
+    except Exception:
+        # Fallback to NullTeilnehmerResolver (default)
+        pass
+
+    return service
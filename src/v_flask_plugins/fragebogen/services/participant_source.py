@@ -29,11 +29,15 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import importlib
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, Callable
 
-from jinja2 import Environment, BaseLoader
+from jinja2 import Environment, BaseLoader, Template
+from sqlalchemy import inspect as sa_inspect, select
+from sqlalchemy.orm import load_only
 
 if TYPE_CHECKING:
     from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
@@ -59,9 +63,28 @@ class FieldMappingError(Exception):
 # Helper Functions
 # =============================================================================
 
+# Seconds a participant source config lookup stays cached
+CONFIG_CACHE_TTL = 300
+
+# Mapped fields available as greeting template variables
+GREETING_FIELDS = ('name', 'email', 'anrede', 'titel')
+
+# Shared environment for greeting templates
+_GREETING_ENV = Environment(loader=BaseLoader())
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_greeting(template: str) -> Template:
+    """Compile a greeting template once per distinct template string."""
+    return _GREETING_ENV.from_string(template)
+
+
+@functools.lru_cache(maxsize=64)
 def load_model_class(model_path: str):
     """Dynamically load a model class from its import path.
 
+    Successful loads are cached for the lifetime of the process.
+
     Args:
         model_path: Full import path (e.g., 'myapp.models.Kunde').
 
@@ -125,6 +148,63 @@ def get_field_value(instance: Any, field_spec: str | dict) -> str | None:
     return None
 
 
+def compile_field_spec(field_spec: str | dict) -> Callable[[Any], str | None] | None:
+    """Compile a field specification into a getter for model instances.
+
+    Used by ParticipantSourceConfig.compiled_field_getters, which compiles
+    a config's field_mapping once; compiled getters are additionally
+    cached per distinct specification.
+
+    Args:
+        field_spec: Either a string (single field) or dict (composite field).
+
+    Returns:
+        Callable taking an instance and returning the value as string
+        (or None), or None for an unsupported specification.
+    """
+    if isinstance(field_spec, str):
+        return _compile_field_getter((field_spec,), None)
+
+    if isinstance(field_spec, dict):
+        fields = tuple(field_spec.get('fields', []))
+        return _compile_field_getter(fields, field_spec.get('separator', ' '))
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_field_getter(
+    fields: tuple[str, ...],
+    separator: str | None
+) -> Callable[[Any], str | None]:
+    """Build a getter for one field (separator None) or a composite field."""
+    if separator is None:
+        # Simple field access
+        name = fields[0]
+
+        def get_single(instance):
+            value = getattr(instance, name, None)
+            return str(value) if value is not None else None
+        return get_single
+
+    # Composite field: join all non-empty parts
+    def get_composite(instance):
+        values = []
+        for name in fields:
+            value = getattr(instance, name, None)
+            if value:
+                values.append(str(value))
+        return separator.join(values) if values else None
+    return get_composite
+
+
+def _prefill_fields(prefill_keys: list[str]) -> tuple[str, ...]:
+    """Get the sorted field names referenced by prefill keys ("typ.field")."""
+    return tuple(sorted({
+        key.split('.', 1)[1] for key in prefill_keys if '.' in key
+    }))
+
+
 # =============================================================================
 # DynamicParticipantResolver
 # =============================================================================
@@ -140,14 +220,20 @@ class DynamicParticipantResolver:
     - Prefill value support for any model field
 
     The resolver implements caching for both config and model lookups to
-    minimize database queries and import overhead.
+    minimize database queries and import overhead. Cached configs (and
+    cached misses) expire after config_ttl seconds, so long-running
+    workers pick up admin changes without clear_cache().
     """
 
-    def __init__(self):
-        """Initialize the resolver with empty caches."""
-        self._config_cache: dict[str, ParticipantSourceConfig | None] = {}
-        self._model_cache: dict[str, type] = {}
-        self._jinja_env = Environment(loader=BaseLoader())
+    def __init__(self, config_ttl: float = CONFIG_CACHE_TTL):
+        """Initialize the resolver with empty caches.
+
+        Args:
+            config_ttl: Seconds a looked-up config (or miss) stays cached.
+        """
+        self.config_ttl = config_ttl
+        self._config_cache: dict[str, tuple[ParticipantSourceConfig | None, float]] = {}
+        self._load_options_cache: dict[tuple[str, tuple[str, ...]], list] = {}
 
     # =========================================================================
     # Cache Management
@@ -159,33 +245,68 @@ class DynamicParticipantResolver:
         Call this after config changes to ensure fresh data is loaded.
         """
         self._config_cache.clear()
-        self._model_cache.clear()
+        self._load_options_cache.clear()
 
     # =========================================================================
     # Internal Helpers
     # =========================================================================
 
     def _get_config(self, teilnehmer_typ: str) -> 'ParticipantSourceConfig | None':
-        """Get cached config for a participant type."""
-        if teilnehmer_typ not in self._config_cache:
-            from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
-            config = ParticipantSourceConfig.get_for_type(teilnehmer_typ)
-            self._config_cache[teilnehmer_typ] = config
-
-        return self._config_cache.get(teilnehmer_typ)
-
-    def _get_model_class(self, model_path: str):
-        """Get cached model class."""
-        if model_path not in self._model_cache:
-            self._model_cache[model_path] = load_model_class(model_path)
-        return self._model_cache[model_path]
-
-    def _get_instance(self, teilnehmer_id: int, teilnehmer_typ: str) -> Any | None:
+        """Get cached config for a participant type (None is cached too)."""
+        now = time.monotonic()
+        cached = self._config_cache.get(teilnehmer_typ)
+        if cached is not None and now - cached[1] < self.config_ttl:
+            return cached[0]
+
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+        config = ParticipantSourceConfig.get_for_type(teilnehmer_typ)
+        self._config_cache[teilnehmer_typ] = (config, now)
+        return config
+
+    def _get_load_options(
+        self,
+        model_class: type,
+        config: 'ParticipantSourceConfig',
+        extra_fields: tuple[str, ...] = ()
+    ) -> list:
+        """Get cached loader options restricting a load to the needed columns.
+
+        Needed are all columns referenced by the field mapping plus
+        extra_fields (e.g. fields named directly in prefill keys).
+        Mapped names that are not columns (properties etc.) are ignored;
+        other columns stay deferred and load on first access.
+        """
+        key = (config.model_path, extra_fields)
+        options = self._load_options_cache.get(key)
+        if options is None:
+            names = set(extra_fields)
+            for field_spec in config.field_mapping.values():
+                if isinstance(field_spec, str):
+                    names.add(field_spec)
+                elif isinstance(field_spec, dict):
+                    names.update(field_spec.get('fields', []))
+
+            columns = [
+                getattr(model_class, attr.key)
+                for attr in sa_inspect(model_class).column_attrs
+                if attr.key in names
+            ]
+            options = [load_only(*columns)] if columns else []
+            self._load_options_cache[key] = options
+        return options
+
+    def _get_instance(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        extra_fields: tuple[str, ...] = ()
+    ) -> Any | None:
         """Load a participant instance from the database.
 
         Args:
             teilnehmer_id: The participant's primary key.
             teilnehmer_typ: The participant type (used to find config).
+            extra_fields: Additional model fields that will be read.
 
         Returns:
             The model instance or None if not found.
@@ -195,114 +316,190 @@ class DynamicParticipantResolver:
             logger.warning(f"No config for participant type: {teilnehmer_typ}")
             return None
 
+        return self._load_instance(config, teilnehmer_id, extra_fields)
+
+    def _load_instance(
+        self,
+        config: 'ParticipantSourceConfig',
+        teilnehmer_id: int,
+        extra_fields: tuple[str, ...] = ()
+    ) -> Any | None:
+        """Load a participant instance for an already resolved config.
+
+        Only the columns needed for the field mapping (and extra_fields)
+        are fetched. Instances already in the session are reused.
+
+        Args:
+            config: The participant type's source config.
+            teilnehmer_id: The participant's primary key.
+            extra_fields: Additional model fields that will be read.
+
+        Returns:
+            The model instance or None if not found.
+        """
         try:
-            model_class = self._get_model_class(config.model_path)
+            model_class = load_model_class(config.model_path)
             from v_flask.extensions import db
-            return db.session.get(model_class, teilnehmer_id)
+            return db.session.get(
+                model_class,
+                teilnehmer_id,
+                options=self._get_load_options(model_class, config, extra_fields)
+            )
         except ModelLoadError as e:
             logger.error(str(e))
             return None
 
+    def get_instances(
+        self,
+        ids: list[int],
+        teilnehmer_typ: str,
+        extra_fields: tuple[str, ...] = ()
+    ) -> dict[int, Any]:
+        """Load several participant instances with one IN query.
+
+        The loaded instances stay in the session's identity map, so later
+        per-id lookups for the same participants are served without a
+        query for as long as the returned dict is referenced. Fields read
+        later beyond the field mapping (e.g. prefill fields) must be passed
+        as extra_fields, otherwise each of them is lazy-loaded per instance.
+
+        Args:
+            ids: The participants' primary keys.
+            teilnehmer_typ: The participant type (used to find config).
+            extra_fields: Additional model fields that will be read.
+
+        Returns:
+            Dict mapping primary key to instance (missing ids are omitted).
+        """
+        config = self._get_config(teilnehmer_typ)
+        if not config or not ids:
+            return {}
+
+        try:
+            model_class = load_model_class(config.model_path)
+        except ModelLoadError as e:
+            logger.error(str(e))
+            return {}
+
+        from v_flask.extensions import db
+        pk_column = sa_inspect(model_class).primary_key[0]
+        stmt = select(model_class).where(pk_column.in_(set(ids))).options(
+            *self._get_load_options(model_class, config, tuple(sorted(set(extra_fields))))
+        )
+        return {
+            getattr(instance, pk_column.key): instance
+            for instance in db.session.scalars(stmt)
+        }
+
     # =========================================================================
     # TeilnehmerResolver Interface
     # =========================================================================
 
-    def get_email(self, teilnehmer_id: int, teilnehmer_typ: str) -> str | None:
-        """Get email address for a participant.
+    def _get_mapped_value(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        key: str,
+        config: 'ParticipantSourceConfig | None' = None
+    ) -> Any | None:
+        """Resolve one field_mapping key for a participant.
 
         Args:
             teilnehmer_id: The participant's primary key.
             teilnehmer_typ: The participant type.
+            key: The field_mapping key (email, name, anrede, titel).
+            config: Already looked-up config for teilnehmer_typ, if any.
 
         Returns:
-            Email address or None if not found.
+            The mapped value or None.
         """
-        config = self._get_config(teilnehmer_typ)
+        config = config or self._get_config(teilnehmer_typ)
         if not config:
             return None
 
-        instance = self._get_instance(teilnehmer_id, teilnehmer_typ)
-        if not instance:
+        getter = config.compiled_field_getters.get(key)
+        if getter is None:
+            if key == 'email':
+                logger.warning(f"No email mapping in config: {config.display_name}")
             return None
 
-        email_spec = config.field_mapping.get('email')
-        if not email_spec:
-            logger.warning(f"No email mapping in config: {config.display_name}")
+        instance = self._load_instance(config, teilnehmer_id)
+        if not instance:
             return None
 
-        return get_field_value(instance, email_spec)
+        return getter(instance)
 
-    def get_name(self, teilnehmer_id: int, teilnehmer_typ: str) -> str | None:
-        """Get display name for a participant.
+    def get_email(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        config: 'ParticipantSourceConfig | None' = None
+    ) -> str | None:
+        """Get email address for a participant.
 
         Args:
             teilnehmer_id: The participant's primary key.
             teilnehmer_typ: The participant type.
+            config: Already looked-up config for teilnehmer_typ, if any.
 
         Returns:
-            Display name or None if not found.
+            Email address or None if not found.
         """
-        config = self._get_config(teilnehmer_typ)
-        if not config:
-            return None
+        return self._get_mapped_value(teilnehmer_id, teilnehmer_typ, 'email', config)
 
-        instance = self._get_instance(teilnehmer_id, teilnehmer_typ)
-        if not instance:
-            return None
+    def get_name(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        config: 'ParticipantSourceConfig | None' = None
+    ) -> str | None:
+        """Get display name for a participant.
 
-        name_spec = config.field_mapping.get('name')
-        if not name_spec:
-            return None
+        Args:
+            teilnehmer_id: The participant's primary key.
+            teilnehmer_typ: The participant type.
+            config: Already looked-up config for teilnehmer_typ, if any.
 
-        return get_field_value(instance, name_spec)
+        Returns:
+            Display name or None if not found.
+        """
+        return self._get_mapped_value(teilnehmer_id, teilnehmer_typ, 'name', config)
 
-    def get_anrede(self, teilnehmer_id: int, teilnehmer_typ: str) -> str | None:
+    def get_anrede(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        config: 'ParticipantSourceConfig | None' = None
+    ) -> str | None:
         """Get salutation (Anrede) for a participant.
 
         Args:
             teilnehmer_id: The participant's primary key.
             teilnehmer_typ: The participant type.
+            config: Already looked-up config for teilnehmer_typ, if any.
 
         Returns:
             Anrede (Herr/Frau/Divers) or None.
         """
-        config = self._get_config(teilnehmer_typ)
-        if not config:
-            return None
-
-        instance = self._get_instance(teilnehmer_id, teilnehmer_typ)
-        if not instance:
-            return None
+        return self._get_mapped_value(teilnehmer_id, teilnehmer_typ, 'anrede', config)
 
-        anrede_spec = config.field_mapping.get('anrede')
-        if not anrede_spec:
-            return None
-
-        return get_field_value(instance, anrede_spec)
-
-    def get_titel(self, teilnehmer_id: int, teilnehmer_typ: str) -> str | None:
+    def get_titel(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        config: 'ParticipantSourceConfig | None' = None
+    ) -> str | None:
         """Get title (Dr., Prof.) for a participant.
 
         Args:
             teilnehmer_id: The participant's primary key.
             teilnehmer_typ: The participant type.
+            config: Already looked-up config for teilnehmer_typ, if any.
 
         Returns:
             Title or None.
         """
-        config = self._get_config(teilnehmer_typ)
-        if not config:
-            return None
-
-        instance = self._get_instance(teilnehmer_id, teilnehmer_typ)
-        if not instance:
-            return None
-
-        titel_spec = config.field_mapping.get('titel')
-        if not titel_spec:
-            return None
-
-        return get_field_value(instance, titel_spec)
+        return self._get_mapped_value(teilnehmer_id, teilnehmer_typ, 'titel', config)
 
     def get_greeting(self, teilnehmer_id: int, teilnehmer_typ: str) -> str | None:
         """Get personalized greeting using template.
@@ -328,17 +525,17 @@ class DynamicParticipantResolver:
         if not config or not config.greeting_template:
             return None
 
-        # Build context for template
-        context = {
-            'name': self.get_name(teilnehmer_id, teilnehmer_typ) or '',
-            'email': self.get_email(teilnehmer_id, teilnehmer_typ) or '',
-            'anrede': self.get_anrede(teilnehmer_id, teilnehmer_typ) or '',
-            'titel': self.get_titel(teilnehmer_id, teilnehmer_typ) or '',
-        }
+        # Build context for template from a single instance load
+        instance = self._load_instance(config, teilnehmer_id)
+        getters = config.compiled_field_getters
+        context = {}
+        for key in GREETING_FIELDS:
+            getter = getters.get(key)
+            value = getter(instance) if getter and instance is not None else None
+            context[key] = value or ''
 
         try:
-            template = self._jinja_env.from_string(config.greeting_template)
-            return template.render(**context).strip()
+            return config.compiled_greeting.render(**context).strip()
         except Exception as e:
             logger.error(f"Error rendering greeting template: {e}")
             return None
@@ -367,10 +564,49 @@ class DynamicParticipantResolver:
         if not config:
             return None
 
-        instance = self._get_instance(teilnehmer_id, teilnehmer_typ)
+        instance = self._load_instance(
+            config, teilnehmer_id, _prefill_fields([prefill_key])
+        )
         if not instance:
             return None
 
+        return self._resolve_prefill_key(instance, config, prefill_key)
+
+    def get_prefill_values(
+        self,
+        teilnehmer_id: int,
+        teilnehmer_typ: str,
+        prefill_keys: list[str]
+    ) -> dict[str, Any]:
+        """Get prefill values for several fields with a single instance load.
+
+        Args:
+            teilnehmer_id: Participant ID.
+            teilnehmer_typ: Participant type.
+            prefill_keys: The prefill keys from the question definitions.
+
+        Returns:
+            Dict mapping each prefill key to its value (or None).
+        """
+        config = self._get_config(teilnehmer_typ)
+        instance = self._load_instance(
+            config, teilnehmer_id, _prefill_fields(prefill_keys)
+        ) if config else None
+        if not instance:
+            return dict.fromkeys(prefill_keys)
+
+        return {
+            key: self._resolve_prefill_key(instance, config, key)
+            for key in prefill_keys
+        }
+
+    def _resolve_prefill_key(
+        self,
+        instance: Any,
+        config: 'ParticipantSourceConfig',
+        prefill_key: str
+    ) -> Any | None:
+        """Resolve a single prefill key against a loaded instance."""
         # Parse prefill key
         # Format: "teilnehmer.email" or "kunde.firmierung"
         parts = prefill_key.split('.', 1)
@@ -386,7 +622,8 @@ class DynamicParticipantResolver:
 
         # First check field_mapping for special mappings
         if field_name in config.field_mapping:
-            return get_field_value(instance, config.field_mapping[field_name])
+            getter = config.compiled_field_getters.get(field_name)
+            return getter(instance) if getter else None
 
         # Otherwise try direct attribute access
         return getattr(instance, field_name, None)
@@ -427,8 +664,7 @@ def generate_greeting(
 
     if template:
         try:
-            env = Environment(loader=BaseLoader())
-            jinja_template = env.from_string(template)
+            jinja_template = _compile_greeting(template)
             return jinja_template.render(
                 anrede=anrede,
                 titel=titel,
@@ -467,19 +703,14 @@ def generate_greeting(
 # Singleton
 # =============================================================================
 
-_dynamic_resolver: DynamicParticipantResolver | None = None
-
-
+@functools.cache
 def get_dynamic_participant_resolver() -> DynamicParticipantResolver:
     """Get the dynamic participant resolver singleton.
 
     Returns:
         The shared DynamicParticipantResolver instance.
     """
-    global _dynamic_resolver
-    if _dynamic_resolver is None:
-        _dynamic_resolver = DynamicParticipantResolver()
-    return _dynamic_resolver
+    return DynamicParticipantResolver()
 
 
 def reset_dynamic_participant_resolver() -> None:
@@ -487,9 +718,8 @@ def reset_dynamic_participant_resolver() -> None:
 
     Call this after ParticipantSourceConfig changes.
     """
-    global _dynamic_resolver
-    if _dynamic_resolver is not None:
-        _dynamic_resolver.clear_cache()
+    if get_dynamic_participant_resolver.cache_info().currsize:
+        get_dynamic_participant_resolver().clear_cache()
 
 
 # =============================================================================
@@ -502,6 +732,7 @@ __all__ = [
     'reset_dynamic_participant_resolver',
     'load_model_class',
     'get_field_value',
+    'compile_field_spec',
     'generate_greeting',
     'ModelLoadError',
     'FieldMappingError',
@@ -23,15 +23,79 @@ Usage:
 In templates:
     {{ render_hero_section() }}
 
+Configuration:
+    HERO_JINJA_BYTECODE_CACHE: Opt in to a Jinja bytecode cache on the
+        app's jinja_env (default: False; skipped if the app already
+        configured one). This is an app-level setting: it applies to all
+        templates of the application, not only the hero templates.
+    HERO_JINJA_BYTECODE_CACHE_DIR: Cache directory (default: Jinja's
+        per-user temp directory).
+
 Dependencies:
     - media: Required for image management
 """
 
+import functools
+import importlib.util
 from pathlib import Path
 
+from flask import request
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
+
 from v_flask.plugins import PluginManifest
 
 
+# Layout variants with a template at hero/<variant>.html
+HERO_VARIANTS = ('centered', 'split', 'overlay')
+
+# Static, so built once at import instead of per settings page load
+_SETTINGS_SCHEMA: list[dict] = [
+    {
+        'key': 'default_variant',
+        'label': 'Standard-Layout',
+        'type': 'select',
+        'description': 'Layout-Variante für neue Hero Sections',
+        'options': [
+            {'value': 'centered', 'label': 'Zentriert'},
+            {'value': 'split', 'label': 'Geteilt'},
+            {'value': 'overlay', 'label': 'Overlay'},
+        ],
+        'default': 'centered',
+    },
+    {
+        'key': 'show_cta_default',
+        'label': 'CTA standardmäßig anzeigen',
+        'type': 'bool',
+        'description': 'Call-to-Action Button in neuen Hero Sections anzeigen',
+        'default': True,
+    },
+    {
+        'key': 'min_height',
+        'label': 'Mindesthöhe (vh)',
+        'type': 'int',
+        'description': 'Mindesthöhe der Hero Section in Viewport-Höhe (50-100)',
+        'default': 60,
+        'min': 50,
+        'max': 100,
+    },
+    {
+        'key': 'excluded_blueprints',
+        'label': 'Ausgeschlossene Blueprints',
+        'type': 'textarea',
+        'description': 'Ein Blueprint pro Zeile. Diese werden bei der Seitenzuweisung nicht angezeigt.',
+        'default': 'admin\nanbieter\nmein_bereich\nmedia\nmedia_admin\ntwo_fa\nauth',
+        'help': 'Blueprints wie "admin", "auth" etc. werden nicht in der Dropdown-Liste für Seitenzuweisungen angezeigt.',
+    },
+    {
+        'key': 'show_only_public',
+        'label': 'Nur öffentliche Seiten anzeigen',
+        'type': 'bool',
+        'description': 'Wenn aktiv, werden nur Seiten vom Typ "page" für Hero-Zuweisungen angezeigt.',
+        'default': True,
+    },
+]
+
+
 class HeroPlugin(PluginManifest):
     """Hero Section plugin for v-flask applications.
 
@@ -119,126 +183,115 @@ Ein flexibles Hero Section Plugin für v-flask Anwendungen.
         """Define available settings for the Hero plugin.
 
         Returns:
-            List of setting definitions for layout and behavior options.
+            List of setting definitions for layout and behavior options
+            (shared module constant; treat as read-only).
         """
-        return [
-            {
-                'key': 'default_variant',
-                'label': 'Standard-Layout',
-                'type': 'select',
-                'description': 'Layout-Variante für neue Hero Sections',
-                'options': [
-                    {'value': 'centered', 'label': 'Zentriert'},
-                    {'value': 'split', 'label': 'Geteilt'},
-                    {'value': 'overlay', 'label': 'Overlay'},
-                ],
-                'default': 'centered',
-            },
-            {
-                'key': 'show_cta_default',
-                'label': 'CTA standardmäßig anzeigen',
-                'type': 'bool',
-                'description': 'Call-to-Action Button in neuen Hero Sections anzeigen',
-                'default': True,
-            },
-            {
-                'key': 'min_height',
-                'label': 'Mindesthöhe (vh)',
-                'type': 'int',
-                'description': 'Mindesthöhe der Hero Section in Viewport-Höhe (50-100)',
-                'default': 60,
-                'min': 50,
-                'max': 100,
-            },
-            {
-                'key': 'excluded_blueprints',
-                'label': 'Ausgeschlossene Blueprints',
-                'type': 'textarea',
-                'description': 'Ein Blueprint pro Zeile. Diese werden bei der Seitenzuweisung nicht angezeigt.',
-                'default': 'admin\nanbieter\nmein_bereich\nmedia\nmedia_admin\ntwo_fa\nauth',
-                'help': 'Blueprints wie "admin", "auth" etc. werden nicht in der Dropdown-Liste für Seitenzuweisungen angezeigt.',
-            },
-            {
-                'key': 'show_only_public',
-                'label': 'Nur öffentliche Seiten anzeigen',
-                'type': 'bool',
-                'description': 'Wenn aktiv, werden nur Seiten vom Typ "page" für Hero-Zuweisungen angezeigt.',
-                'default': True,
-            },
-        ]
+        return _SETTINGS_SCHEMA
 
     def on_init(self, app):
         """Register context processor and content slot provider."""
-        from flask import request
-        from v_flask_plugins.hero.services.hero_service import hero_service
-
         # Register Hero as a content slot provider for the generic slot system
-        try:
+        if importlib.util.find_spec('v_flask.content_slots') is None:
+            # Older v-flask without content slots
+            app.logger.debug('Hero slot provider registration skipped: no content slots')
+        else:
             from v_flask import content_slot_registry
             from v_flask_plugins.hero.slot_provider import hero_slot_provider
 
-            content_slot_registry.register(hero_slot_provider)
-            app.logger.debug('Hero plugin registered as content slot provider')
-        except (ImportError, ValueError) as e:
-            # ImportError: content_slots not available (older v-flask)
-            # ValueError: Already registered (e.g., during hot reload)
-            app.logger.debug(f'Hero slot provider registration skipped: {e}')
-
-        @app.context_processor
-        def hero_context():
-            """Provide hero rendering functions to templates."""
-
-            def render_hero_section():
-                """Render the active hero section (legacy).
-
-                Usage in templates:
-                    {{ render_hero_section() }}
-
-                Returns:
-                    Rendered HTML string or empty string if no hero configured.
-                """
-                return hero_service.render_active_hero()
-
-            def get_active_hero():
-                """Get the active hero section model.
-
-                Usage in templates:
-                    {% set hero = get_active_hero() %}
-                    {% if hero %}
-                        {% include 'hero/' ~ hero.variant ~ '.html' %}
-                    {% endif %}
-
-                Returns:
-                    HeroSection instance or None.
-                """
-                return hero_service.get_active_hero()
-
-            def render_hero_slot(slot: str = 'hero_top') -> str:
-                """Render hero section for current endpoint and slot.
-
-                New route-based hero rendering. Finds the hero section
-                assigned to the current page and specified slot position.
-
-                Usage in templates:
-                    {{ render_hero_slot('hero_top') }}
-                    {{ render_hero_slot('above_content') }}
-                    {{ render_hero_slot('below_content') }}
-
-                Args:
-                    slot: Slot position ('hero_top', 'above_content', 'below_content').
-
-                Returns:
-                    Rendered HTML string or empty string if no hero assigned.
-                """
-                if not request.endpoint:
-                    return ''
-                return hero_service.render_hero_slot(request.endpoint, slot)
-
-            return {
-                'render_hero_section': render_hero_section,  # Legacy
-                'get_active_hero': get_active_hero,
-                'render_hero_slot': render_hero_slot,  # New route-based
-            }
+            # Already registered e.g. during hot reload or a second app
+            if hero_slot_provider.name not in content_slot_registry.provider_names:
+                content_slot_registry.register(hero_slot_provider)
+                app.logger.debug('Hero plugin registered as content slot provider')
+
+        app.context_processor(hero_context)
+
+        # Opt-in: share compiled template bytecode between worker processes.
+        # Affects the whole app's jinja_env, so it is off by default.
+        if app.config.get('HERO_JINJA_BYTECODE_CACHE') and app.jinja_env.bytecode_cache is None:
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+                app.config.get('HERO_JINJA_BYTECODE_CACHE_DIR')
+            )
+
+        # Compile the public variant templates now instead of on the
+        # first page view (kept in the Jinja environment's template cache)
+        for variant in HERO_VARIANTS:
+            try:
+                app.jinja_env.get_template(f'hero/{variant}.html')
+            except TemplateNotFound:
+                app.logger.debug(f'Hero variant template missing: {variant}')
+
+
+# =============================================================================
+# Template Context
+# =============================================================================
+
+@functools.cache
+def _get_hero_service():
+    """Import the hero service on first use (keeps CLI/app startup light)."""
+    from v_flask_plugins.hero.services.hero_service import hero_service
+    return hero_service
+
+
+def render_hero_section() -> str:
+    """Render the active hero section (legacy).
+
+    Usage in templates:
+        {{ render_hero_section() }}
+
+    Returns:
+        Rendered HTML string or empty string if no hero configured.
+    """
+    return _get_hero_service().render_active_hero()
+
+
+def get_active_hero():
+    """Get the active hero section model.
+
+    Usage in templates:
+        {% set hero = get_active_hero() %}
+        {% if hero %}
+            {% include 'hero/' ~ hero.variant ~ '.html' %}
+        {% endif %}
+
+    Returns:
+        HeroSection instance or None.
+    """
+    return _get_hero_service().get_active_hero()
+
+
+def render_hero_slot(slot: str = 'hero_top') -> str:
+    """Render hero section for current endpoint and slot.
+
+    New route-based hero rendering. Finds the hero section
+    assigned to the current page and specified slot position.
+
+    Usage in templates:
+        {{ render_hero_slot('hero_top') }}
+        {{ render_hero_slot('above_content') }}
+        {{ render_hero_slot('below_content') }}
+
+    Args:
+        slot: Slot position ('hero_top', 'above_content', 'below_content').
+
+    Returns:
+        Rendered HTML string or empty string if no hero assigned.
+    """
+    if not request.endpoint:
+        return ''
+    return _get_hero_service().render_hero_slot(request.endpoint, slot)
+
+
+# Built once; Flask only merges it into each template context
+_HERO_CONTEXT = {
+    'render_hero_section': render_hero_section,  # Legacy
+    'get_active_hero': get_active_hero,
+    'render_hero_slot': render_hero_slot,  # New route-based
+}
+
+
+def hero_context() -> dict:
+    """Provide hero rendering functions to templates."""
+    return _HERO_CONTEXT
 
 
 # Export the plugin class
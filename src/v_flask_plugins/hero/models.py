@@ -9,6 +9,8 @@ PageRoute is imported from v_flask.content_slots (core module).
 
 from datetime import datetime
 
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from v_flask.extensions import db
 from v_flask.content_slots.models import PageRoute  # Import from Core
 
@@ -93,6 +95,13 @@ class HeroAssignment(db.Model):
             'page_route_id', 'slot_position',
             name='uq_hero_assignment_page_slot'
         ),
+        # Covers the per-request slot lookup (filter + priority order)
+        db.Index(
+            'idx_hero_assignment_lookup',
+            'page_route_id', 'slot_position', 'active', 'priority'
+        ),
+        # Assignments per hero (admin list, cascade deletes)
+        db.Index('idx_hero_assignment_hero', 'hero_section_id'),
     )
 
     def __repr__(self) -> str:
@@ -147,6 +156,14 @@ class HeroTemplate(db.Model):
         onupdate=datetime.utcnow
     )
 
+    # Matches the admin/picker sort order (default first, then by name)
+    __table_args__ = (
+        db.Index(
+            'idx_hero_template_default_name',
+            is_default.desc(), name
+        ),
+    )
+
     def __repr__(self) -> str:
         return f'<HeroTemplate {self.slug}: {self.name}>'
 
@@ -226,13 +243,14 @@ class HeroSection(db.Model):
     )
 
     # Relationships
+    # Plain lazy backrefs: loaded on access only, no Query per access
     template = db.relationship(
         'HeroTemplate',
-        backref=db.backref('hero_sections', lazy='dynamic')
+        backref='hero_sections'
     )
     media = db.relationship(
         'Media',
-        backref=db.backref('hero_sections', lazy='dynamic')
+        backref='hero_sections'
     )
     assignments = db.relationship(
         'HeroAssignment',
@@ -240,6 +258,15 @@ class HeroSection(db.Model):
         cascade='all, delete-orphan'
     )
 
+    # Partial index for the legacy "active hero" lookup
+    __table_args__ = (
+        db.Index(
+            'idx_hero_section_active', 'active',
+            postgresql_where=db.text('active'),
+            sqlite_where=db.text('active'),
+        ),
+    )
+
     def __repr__(self) -> str:
         status = 'active' if self.active else 'inactive'
         name = self.name or f'#{self.id}'
@@ -257,9 +284,12 @@ class HeroSection(db.Model):
         """Return the image URL (from media or legacy path).
 
         Provides backwards compatibility - prefers media URL over legacy path.
+        The media relationship is only touched when a media_id is set.
         """
-        if self.media:
-            return self.media.get_url('large')
+        if self.media_id is not None:
+            media = self.media
+            if media:
+                return media.get_url('large')
         return self._image_path
 
     @image_path.setter
@@ -267,7 +297,7 @@ class HeroSection(db.Model):
         """Set the legacy image path (for backwards compatibility)."""
         self._image_path = value
 
-    @property
+    @hybrid_property
     def title(self) -> str:
         """Return the effective title (custom or from template)."""
         if self.custom_title:
@@ -276,7 +306,19 @@ class HeroSection(db.Model):
             return self.template.titel
         return ''
 
-    @property
+    @title.inplace.expression
+    @classmethod
+    def _title_expression(cls):
+        """SQL equivalent of title, usable in queries without loading templates."""
+        return db.func.coalesce(
+            db.func.nullif(cls.custom_title, ''),
+            db.select(HeroTemplate.titel)
+            .where(HeroTemplate.id == cls.template_id)
+            .scalar_subquery(),
+            ''
+        )
+
+    @hybrid_property
     def subtitle(self) -> str:
         """Return the effective subtitle (custom or from template)."""
         if self.custom_subtitle:
@@ -285,14 +327,28 @@ class HeroSection(db.Model):
             return self.template.untertitel
         return ''
 
+    @subtitle.inplace.expression
+    @classmethod
+    def _subtitle_expression(cls):
+        """SQL equivalent of subtitle, usable in queries without loading templates."""
+        return db.func.coalesce(
+            db.func.nullif(cls.custom_subtitle, ''),
+            db.select(HeroTemplate.untertitel)
+            .where(HeroTemplate.id == cls.template_id)
+            .scalar_subquery(),
+            ''
+        )
+
     def to_dict(self) -> dict:
         """Return dictionary representation for API/JSON responses."""
+        # Serialize media once and reuse its large URL as image_path
+        media = self.media.to_dict() if self.media else None
         result = {
             'id': self.id,
             'name': self.name,
             'display_name': self.display_name,
             'variant': self.variant,
-            'image_path': self.image_path,
+            'image_path': media['url_large'] if media else self._image_path,
             'media_id': self.media_id,
             'title': self.title,
             'subtitle': self.subtitle,
@@ -300,6 +356,6 @@ class HeroSection(db.Model):
             'cta_link': self.cta_link,
             'active': self.active,
         }
-        if self.media:
-            result['media'] = self.media.to_dict()
+        if media:
+            result['media'] = media
         return result
@@ -6,6 +6,9 @@ Provides:
     - Media picker integration for background images
 """
 
+import time
+from types import MappingProxyType
+
 from flask import (
     Blueprint,
     current_app,
@@ -15,6 +18,8 @@ from flask import (
     redirect,
     url_for,
 )
+from sqlalchemy import delete, exists, select
+from sqlalchemy.orm import joinedload
 
 from v_flask.extensions import db
 from v_flask.auth import admin_required
@@ -31,6 +36,99 @@ hero_admin_bp = Blueprint(
     template_folder='templates'
 )
 
+# Layout variants offered in the editor forms
+_VARIANTS = (
+    {'value': 'centered', 'label': 'Zentriert', 'icon': 'ti-align-center'},
+    {'value': 'split', 'label': 'Geteilt', 'icon': 'ti-layout-columns'},
+    {'value': 'overlay', 'label': 'Overlay', 'icon': 'ti-photo'},
+)
+
+# Blueprint-Namen Mapping für schönere Anzeige (read-only)
+_BLUEPRINT_NAMES = MappingProxyType({
+    'datenschutz': 'Datenschutz',
+    'datenschutz_admin': 'Datenschutz (Admin)',
+    'impressum': 'Impressum',
+    'impressum_admin': 'Impressum (Admin)',
+    'kontakt': 'Kontakt-Formular',
+    'kontakt_admin': 'Kontakt (Admin)',
+    'fragebogen': 'Fragebogen',
+    'fragebogen_admin': 'Fragebogen (Admin)',
+    'media_admin': 'Media (Admin)',
+    'hero_admin': 'Hero (Admin)',
+    'public': 'System (Öffentlich)',
+    'admin': 'System (Admin)',
+    'auth': 'System (Auth)',
+    'api': 'System (API)',
+})
+
+_SYNC_MESSAGE = (
+    'Routen synchronisiert: {added} neu, {removed} entfernt, '
+    '{unchanged} unverändert.'
+)
+
+# Preview image URLs by media ID: (url, monotonic timestamp)
+MEDIA_URL_CACHE_TTL = 30
+MEDIA_URL_CACHE_SIZE = 256
+_media_url_cache: dict[int, tuple[str | None, float]] = {}
+
+# Template context shared by all hero admin templates
+_ADMIN_CONTEXT = {
+    'blueprint_names': _BLUEPRINT_NAMES,
+    'variants': _VARIANTS,
+}
+
+
+@hero_admin_bp.context_processor
+def _admin_context() -> dict:
+    """Provide blueprint names and layout variants to hero admin templates."""
+    return _ADMIN_CONTEXT
+
+
+def _clean(field: str, default: str | None = None) -> str | None:
+    """Get a stripped form value, or default if it is empty.
+
+    Args:
+        field: Form field name.
+        default: Value for missing or blank fields.
+
+    Returns:
+        Stripped field value or default.
+    """
+    value = request.form.get(field)
+    if not value:
+        return default
+    # Most values carry no surrounding whitespace: skip the strip copy
+    if not (value[0].isspace() or value[-1].isspace()):
+        return value
+    return value.strip() or default
+
+
+def _get_media_url(media_id: int) -> str | None:
+    """Get the large image URL of a media item for the live preview.
+
+    The preview fires on every keystroke, so URLs are cached for
+    MEDIA_URL_CACHE_TTL seconds instead of loading the Media row each time.
+
+    Args:
+        media_id: Media ID.
+
+    Returns:
+        Image URL or None if the media item does not exist.
+    """
+    now = time.monotonic()
+    cached = _media_url_cache.get(media_id)
+    if cached is not None and now - cached[1] < MEDIA_URL_CACHE_TTL:
+        return cached[0]
+
+    from v_flask_plugins.media.models import Media
+    media = db.session.get(Media, media_id)
+    url = media.get_url('large') if media else None
+
+    if len(_media_url_cache) >= MEDIA_URL_CACHE_SIZE:
+        _media_url_cache.clear()
+    _media_url_cache[media_id] = (url, now)
+    return url
+
 
 # === Editor Route ===
 
@@ -43,17 +141,18 @@ def editor():
     Supports media_id URL parameter for automatic image adoption from media library.
     """
     # Get or create active hero section
-    hero = HeroSection.query.filter_by(active=True).first()
-    if not hero:
+    hero = hero_service.get_active_hero()
+    created = hero is None
+    if created:
         # Create default hero section if none exists
         hero = HeroSection(
             variant='centered',
             active=True
         )
         db.session.add(hero)
-        db.session.commit()
 
     # Handle media adoption from media library picker
+    # (committed together with a newly created hero)
     new_media_id = request.args.get('media_id', type=int)
     if new_media_id:
         hero.media_id = new_media_id
@@ -61,6 +160,9 @@ def editor():
         flash('Bild übernommen', 'success')
         return redirect(url_for('hero_admin.editor'))
 
+    if created:
+        db.session.commit()
+
     templates = hero_service.get_all_templates()
 
     # Generate preview HTML for the current hero section
@@ -71,11 +173,6 @@ def editor():
         hero=hero,
         templates=templates,
         preview_html=preview_html,
-        variants=[
-            {'value': 'centered', 'label': 'Zentriert', 'icon': 'ti-align-center'},
-            {'value': 'split', 'label': 'Geteilt', 'icon': 'ti-layout-columns'},
-            {'value': 'overlay', 'label': 'Overlay', 'icon': 'ti-photo'},
-        ]
     )
 
 
@@ -83,7 +180,7 @@ def editor():
 @admin_required
 def save():
     """Save hero section configuration."""
-    hero = HeroSection.query.filter_by(active=True).first()
+    hero = hero_service.get_active_hero()
     if not hero:
         hero = HeroSection(active=True)
         db.session.add(hero)
@@ -105,14 +202,16 @@ def save():
         hero.custom_subtitle = None
     else:
         hero.template_id = None
-        hero.custom_title = request.form.get('custom_title', '').strip()
-        hero.custom_subtitle = request.form.get('custom_subtitle', '').strip()
+        hero.custom_title = _clean('custom_title', '')
+        hero.custom_subtitle = _clean('custom_subtitle', '')
 
     # CTA
-    hero.cta_text = request.form.get('cta_text', '').strip() or None
-    hero.cta_link = request.form.get('cta_link', '').strip() or None
+    hero.cta_text = _clean('cta_text')
+    hero.cta_link = _clean('cta_link')
 
-    db.session.commit()
+    # Auto-save fires on blur: skip the COMMIT if nothing changed
+    if hero in db.session.new or db.session.is_modified(hero):
+        db.session.commit()
     flash('Hero Section gespeichert.', 'success')
 
     # HTMX request - return updated preview
@@ -131,7 +230,8 @@ def save():
 def preview():
     """Generate live preview for hero section.
 
-    HTMX endpoint for real-time preview updates.
+    HTMX endpoint for real-time preview updates. The response is
+    streamed, so the first chunk reaches the browser while rendering.
     """
     variant = request.form.get('variant', 'centered')
     text_source = request.form.get('text_source', 'custom')
@@ -148,34 +248,32 @@ def preview():
         title = request.form.get('custom_title', '')
         subtitle = request.form.get('custom_subtitle', '')
 
-    cta_text = request.form.get('cta_text', '').strip() or None
-    cta_link = request.form.get('cta_link', '').strip() or None
+    cta_text = _clean('cta_text')
+    cta_link = _clean('cta_link')
 
     # Get image path from media_id or current hero
     media_id = request.form.get('media_id')
     image_path = None
 
     if media_id:
-        from v_flask_plugins.media.models import Media
-        media = db.session.get(Media, int(media_id))
-        if media:
-            image_path = media.get_url('large')
+        image_path = _get_media_url(int(media_id))
     else:
         # Fallback to current hero's image
-        hero = HeroSection.query.filter_by(active=True).first()
+        hero = hero_service.get_active_hero()
         image_path = hero.image_path if hero else None
 
-    preview_html = hero_service.render_hero_preview(
-        variant=variant,
-        title=title,
-        subtitle=subtitle,
-        cta_text=cta_text,
-        cta_link=cta_link,
-        image_path=image_path
+    return current_app.response_class(
+        hero_service.stream_hero_preview(
+            variant=variant,
+            title=title,
+            subtitle=subtitle,
+            cta_text=cta_text,
+            cta_link=cta_link,
+            image_path=image_path
+        ),
+        mimetype='text/html'
     )
 
-    return preview_html
-
 
 @hero_admin_bp.route('/update-media', methods=['POST'])
 @admin_required
@@ -186,10 +284,12 @@ def update_media():
     """
     media_id = request.form.get('media_id')
 
-    hero = HeroSection.query.filter_by(active=True).first()
+    hero = hero_service.get_active_hero()
     if hero:
-        hero.media_id = int(media_id) if media_id else None
-        db.session.commit()
+        new_media_id = int(media_id) if media_id else None
+        if hero.media_id != new_media_id:
+            hero.media_id = new_media_id
+            db.session.commit()
 
         if request.headers.get('HX-Request'):
             return render_template(
@@ -206,9 +306,11 @@ def update_media():
 @admin_required
 def list_templates():
     """List all hero templates."""
-    templates = HeroTemplate.query.order_by(
-        HeroTemplate.is_default.desc(),
-        HeroTemplate.name
+    templates = db.session.scalars(
+        select(HeroTemplate).order_by(
+            HeroTemplate.is_default.desc(),
+            HeroTemplate.name
+        )
     ).all()
 
     return render_template(
@@ -223,10 +325,10 @@ def create_template():
     """Create a new hero template."""
     if request.method == 'POST':
         template = HeroTemplate(
-            slug=request.form.get('slug', '').strip(),
-            name=request.form.get('name', '').strip(),
-            titel=request.form.get('titel', '').strip(),
-            untertitel=request.form.get('untertitel', '').strip(),
+            slug=_clean('slug', ''),
+            name=_clean('name', ''),
+            titel=_clean('titel', ''),
+            untertitel=_clean('untertitel', ''),
             is_default=bool(request.form.get('is_default')),
         )
         db.session.add(template)
@@ -247,10 +349,10 @@ def edit_template(template_id: int):
         return redirect(url_for('hero_admin.list_templates'))
 
     if request.method == 'POST':
-        template.slug = request.form.get('slug', '').strip()
-        template.name = request.form.get('name', '').strip()
-        template.titel = request.form.get('titel', '').strip()
-        template.untertitel = request.form.get('untertitel', '').strip()
+        template.slug = _clean('slug', '')
+        template.name = _clean('name', '')
+        template.titel = _clean('titel', '')
+        template.untertitel = _clean('untertitel', '')
         template.is_default = bool(request.form.get('is_default'))
         template.active = bool(request.form.get('active', True))
 
@@ -267,20 +369,29 @@ def edit_template(template_id: int):
 @hero_admin_bp.route('/templates/<int:template_id>/delete', methods=['POST'])
 @admin_required
 def delete_template(template_id: int):
-    """Delete a hero template."""
-    template = db.session.get(HeroTemplate, template_id)
-    if template:
-        # Check if template is in use
+    """Delete a hero template.
+
+    Deletes only if no hero section uses the template (single guarded
+    DELETE); the usage count is queried only when nothing was deleted.
+    """
+    result = db.session.execute(
+        delete(HeroTemplate).where(
+            HeroTemplate.id == template_id,
+            ~exists().where(HeroSection.template_id == template_id),
+        )
+    )
+    db.session.commit()
+
+    if result.rowcount:
+        flash('Template gelöscht.', 'success')
+    else:
+        # Template missing or in use
         in_use = HeroSection.query.filter_by(template_id=template_id).count()
         if in_use > 0:
             flash(
                 f'Template wird von {in_use} Hero Section(s) verwendet und kann nicht gelöscht werden.',
                 'error'
             )
-        else:
-            db.session.delete(template)
-            db.session.commit()
-            flash('Template gelöscht.', 'success')
 
     return redirect(url_for('hero_admin.list_templates'))
 
@@ -315,10 +426,13 @@ def list_sections():
     New management view for multiple hero sections with assignments.
     """
     sections = hero_service.get_all_hero_sections()
+    # Resolve each preview image once (the template needs it twice)
+    image_paths = {section.id: section.image_path for section in sections}
 
     return render_template(
         'hero/admin/list.html',
         sections=sections,
+        image_paths=image_paths,
     )
 
 
@@ -328,7 +442,7 @@ def create_section():
     """Create a new hero section."""
     if request.method == 'POST':
         hero = HeroSection(
-            name=request.form.get('name', '').strip() or None,
+            name=_clean('name'),
             variant=request.form.get('variant', 'centered'),
             active=bool(request.form.get('active')),
         )
@@ -339,12 +453,12 @@ def create_section():
             template_id = request.form.get('template_id')
             hero.template_id = int(template_id) if template_id else None
         else:
-            hero.custom_title = request.form.get('custom_title', '').strip()
-            hero.custom_subtitle = request.form.get('custom_subtitle', '').strip()
+            hero.custom_title = _clean('custom_title', '')
+            hero.custom_subtitle = _clean('custom_subtitle', '')
 
         # CTA
-        hero.cta_text = request.form.get('cta_text', '').strip() or None
-        hero.cta_link = request.form.get('cta_link', '').strip() or None
+        hero.cta_text = _clean('cta_text')
+        hero.cta_link = _clean('cta_link')
 
         # Media
         media_id = request.form.get('media_id')
@@ -357,17 +471,11 @@ def create_section():
         return redirect(url_for('hero_admin.edit_section', section_id=hero.id))
 
     templates = hero_service.get_all_templates()
-    variants = [
-        {'value': 'centered', 'label': 'Zentriert', 'icon': 'ti-align-center'},
-        {'value': 'split', 'label': 'Geteilt', 'icon': 'ti-layout-columns'},
-        {'value': 'overlay', 'label': 'Overlay', 'icon': 'ti-photo'},
-    ]
 
     return render_template(
         'hero/admin/section_form.html',
         hero=None,
         templates=templates,
-        variants=variants,
         available_routes=route_sync_service.get_assignable_routes(),
     )
 
@@ -382,7 +490,7 @@ def edit_section(section_id: int):
         return redirect(url_for('hero_admin.list_sections'))
 
     if request.method == 'POST':
-        hero.name = request.form.get('name', '').strip() or None
+        hero.name = _clean('name')
         hero.variant = request.form.get('variant', 'centered')
         hero.active = bool(request.form.get('active'))
 
@@ -395,12 +503,12 @@ def edit_section(section_id: int):
             hero.custom_subtitle = None
         else:
             hero.template_id = None
-            hero.custom_title = request.form.get('custom_title', '').strip()
-            hero.custom_subtitle = request.form.get('custom_subtitle', '').strip()
+            hero.custom_title = _clean('custom_title', '')
+            hero.custom_subtitle = _clean('custom_subtitle', '')
 
         # CTA
-        hero.cta_text = request.form.get('cta_text', '').strip() or None
-        hero.cta_link = request.form.get('cta_link', '').strip() or None
+        hero.cta_text = _clean('cta_text')
+        hero.cta_link = _clean('cta_link')
 
         # Media
         media_id = request.form.get('media_id')
@@ -419,23 +527,13 @@ def edit_section(section_id: int):
         return redirect(url_for('hero_admin.edit_section', section_id=hero.id))
 
     templates = hero_service.get_all_templates()
-    variants = [
-        {'value': 'centered', 'label': 'Zentriert', 'icon': 'ti-align-center'},
-        {'value': 'split', 'label': 'Geteilt', 'icon': 'ti-layout-columns'},
-        {'value': 'overlay', 'label': 'Overlay', 'icon': 'ti-photo'},
-    ]
     assignments = hero_service.get_assignments_for_hero(section_id)
-    assigned_route_ids = {a.page_route_id for a in assignments}
-    available_routes = [
-        r for r in route_sync_service.get_assignable_routes()
-        if r.id not in assigned_route_ids
-    ]
+    available_routes = route_sync_service.get_unassigned_routes(section_id)
 
     return render_template(
         'hero/admin/section_form.html',
         hero=hero,
         templates=templates,
-        variants=variants,
         assignments=assignments,
         available_routes=available_routes,
         preview_html=hero_service.render_hero(hero),
@@ -467,47 +565,24 @@ def list_routes():
     hero_assignable_param = request.args.get('hero_assignable', 'yes')
     blueprint_param = request.args.get('blueprint', '')
 
-    # Query aufbauen
-    query = PageRoute.query
-
-    if hero_assignable_param == 'yes':
-        query = query.filter_by(hero_assignable=True)
-    elif hero_assignable_param == 'no':
-        query = query.filter_by(hero_assignable=False)
-    # 'all' → kein Filter
-
-    if blueprint_param:
-        query = query.filter_by(blueprint=blueprint_param)
-
-    routes = query.order_by(
+    # Alle Routes in einem Query laden (kleine Tabelle), Filter in Python
+    all_routes = PageRoute.query.order_by(
         PageRoute.route_type,
         PageRoute.blueprint,
         PageRoute.display_name
     ).all()
 
+    routes = all_routes
+    if hero_assignable_param in ('yes', 'no'):
+        assignable = hero_assignable_param == 'yes'
+        routes = [r for r in routes if r.hero_assignable == assignable]
+    # 'all' → kein Filter
+
+    if blueprint_param:
+        routes = [r for r in routes if r.blueprint == blueprint_param]
+
     # Verfügbare Blueprints für Dropdown (immer alle, unabhängig von Filtern)
-    available_blueprints = db.session.query(
-        PageRoute.blueprint
-    ).distinct().order_by(PageRoute.blueprint).all()
-    available_blueprints = [bp[0] for bp in available_blueprints if bp[0]]
-
-    # Blueprint-Namen Mapping für schönere Anzeige
-    blueprint_names = {
-        'datenschutz': 'Datenschutz',
-        'datenschutz_admin': 'Datenschutz (Admin)',
-        'impressum': 'Impressum',
-        'impressum_admin': 'Impressum (Admin)',
-        'kontakt': 'Kontakt-Formular',
-        'kontakt_admin': 'Kontakt (Admin)',
-        'fragebogen': 'Fragebogen',
-        'fragebogen_admin': 'Fragebogen (Admin)',
-        'media_admin': 'Media (Admin)',
-        'hero_admin': 'Hero (Admin)',
-        'public': 'System (Öffentlich)',
-        'admin': 'System (Admin)',
-        'auth': 'System (Auth)',
-        'api': 'System (API)',
-    }
+    available_blueprints = sorted({r.blueprint for r in all_routes if r.blueprint})
 
     filters = {
         'hero_assignable': hero_assignable_param,
@@ -519,7 +594,6 @@ def list_routes():
         routes=routes,
         filters=filters,
         available_blueprints=available_blueprints,
-        blueprint_names=blueprint_names,
     )
 
 
@@ -533,12 +607,7 @@ def sync_routes():
     """
     stats = route_sync_service.sync_routes(current_app)
 
-    flash(
-        f'Routen synchronisiert: {stats["added"]} neu, '
-        f'{stats["removed"]} entfernt, {stats["unchanged"]} unverändert.',
-        'success'
-    )
-
+    # HTMX swaps the table directly: no flash, so no session write
     if request.headers.get('HX-Request'):
         # Nach Sync: Alle Routes zeigen (auch nicht-zuweisbare)
         routes = PageRoute.query.order_by(
@@ -547,30 +616,12 @@ def sync_routes():
             PageRoute.display_name
         ).all()
 
-        # Blueprint-Namen für Tabelle
-        blueprint_names = {
-            'datenschutz': 'Datenschutz',
-            'datenschutz_admin': 'Datenschutz (Admin)',
-            'impressum': 'Impressum',
-            'impressum_admin': 'Impressum (Admin)',
-            'kontakt': 'Kontakt-Formular',
-            'kontakt_admin': 'Kontakt (Admin)',
-            'fragebogen': 'Fragebogen',
-            'fragebogen_admin': 'Fragebogen (Admin)',
-            'media_admin': 'Media (Admin)',
-            'hero_admin': 'Hero (Admin)',
-            'public': 'System (Öffentlich)',
-            'admin': 'System (Admin)',
-            'auth': 'System (Auth)',
-            'api': 'System (API)',
-        }
-
         return render_template(
             'hero/admin/_route_list.html',
             routes=routes,
-            blueprint_names=blueprint_names,
         )
 
+    flash(_SYNC_MESSAGE.format_map(stats), 'success')
     return redirect(url_for('hero_admin.list_routes'))
 
 
@@ -584,22 +635,16 @@ def edit_route(route_id: int):
         return redirect(url_for('hero_admin.list_routes'))
 
     if request.method == 'POST':
-        route.display_name = request.form.get('display_name', '').strip() or None
+        route.display_name = _clean('display_name')
         route.hero_assignable = bool(request.form.get('hero_assignable'))
         db.session.commit()
         flash('Route aktualisiert.', 'success')
 
         if request.headers.get('HX-Request'):
-            return f'''
-            <td class="font-medium">{route.display_name or route.endpoint}</td>
-            <td class="font-mono text-sm">{route.endpoint}</td>
-            <td class="font-mono text-xs text-base-content/60">{route.rule}</td>
-            <td>
-                <span class="badge badge-{'success' if route.hero_assignable else 'ghost'}">
-                    {'Ja' if route.hero_assignable else 'Nein'}
-                </span>
-            </td>
-            '''
+            return render_template(
+                'hero/admin/_route_row.html',
+                route=route
+            )
 
         return redirect(url_for('hero_admin.list_routes'))
 
@@ -639,11 +684,7 @@ def assign_hero(hero_id: int):
     if assignment:
         # Return updated assignments list
         assignments = hero_service.get_assignments_for_hero(hero_id)
-        assigned_route_ids = {a.page_route_id for a in assignments}
-        available_routes = [
-            r for r in route_sync_service.get_assignable_routes()
-            if r.id not in assigned_route_ids
-        ]
+        available_routes = route_sync_service.get_unassigned_routes(hero_id)
 
         return render_template(
             'hero/admin/_assignments.html',
@@ -662,20 +703,21 @@ def remove_assignment(assignment_id: int):
 
     HTMX endpoint for removing assignment.
     """
-    assignment = db.session.get(HeroAssignment, assignment_id)
+    # Assignment and its hero in one query
+    assignment = HeroAssignment.query.options(
+        joinedload(HeroAssignment.hero_section)
+    ).filter_by(id=assignment_id).first()
     if not assignment:
         return '<div class="alert alert-error">Zuweisung nicht gefunden.</div>'
 
-    hero = db.session.get(HeroSection, assignment.hero_section_id)
+    hero = assignment.hero_section
+    hero_id = hero.id
+    # Served from the identity map, no second SELECT
     hero_service.remove_assignment(assignment_id)
 
     # Return updated assignments list
-    assignments = hero_service.get_assignments_for_hero(hero.id)
-    assigned_route_ids = {a.page_route_id for a in assignments}
-    available_routes = [
-        r for r in route_sync_service.get_assignable_routes()
-        if r.id not in assigned_route_ids
-    ]
+    assignments = hero_service.get_assignments_for_hero(hero_id)
+    available_routes = route_sync_service.get_unassigned_routes(hero_id)
 
     return render_template(
         'hero/admin/_assignments.html',
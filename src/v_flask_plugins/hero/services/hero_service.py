@@ -8,16 +8,112 @@ Provides business logic for hero sections including:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import functools
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Iterator
 
-from flask import render_template_string
-from jinja2 import Template
+from flask import current_app, g, render_template, stream_template
+from jinja2 import Environment, Template
+
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager, joinedload, load_only, selectinload
 
 from v_flask.extensions import db
+from v_flask.models import Betreiber
+from v_flask_plugins.hero.models import (
+    HeroAssignment,
+    HeroSection,
+    HeroTemplate,
+    PageRoute,
+)
+
+
+# Shared environment for hero texts (title/subtitle placeholders)
+_TEXT_ENV = Environment()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_text(text: str) -> Template:
+    """Compile a hero text template once per distinct text.
+
+    Keyed by the text itself, so edited texts simply compile anew.
+    """
+    return _TEXT_ENV.from_string(text)
+
+
+# Plain context lookups like {{ betreiber.name }} (no filters/expressions)
+_SIMPLE_PLACEHOLDER_RE = re.compile(
+    r'\{\{\s*(betreiber|plattform|location)\.(\w+)\s*\}\}'
+)
+
+
+def _render_placeholders(text: str, context: dict[str, Any]) -> str:
+    """Render the placeholders of a hero text.
+
+    Texts without any Jinja2 syntax are returned unchanged and texts with
+    only plain context lookups are substituted directly, both without
+    touching Jinja2. Everything else (and trailing newlines, which Jinja2
+    strips) goes through the compiled template.
+    """
+    if not text.endswith('\n'):
+        if '{' not in text:
+            return text
+        if '{' not in _SIMPLE_PLACEHOLDER_RE.sub('', text):
+            values = {}
+            for namespace, key in _SIMPLE_PLACEHOLDER_RE.findall(text):
+                data = context.get(namespace)
+                if not isinstance(data, dict) or key not in data:
+                    break
+                values[namespace, key] = str(data[key])
+            else:
+                return _SIMPLE_PLACEHOLDER_RE.sub(
+                    lambda m: values[m[1], m[2]], text
+                )
+    return _compile_text(text).render(context)
+
+
+# Fallback markup if a variant template is missing (compiled once)
+_FALLBACK_TEMPLATE = Environment(autoescape=True).from_string('''
+        <section class="hero bg-base-200 py-20">
+            <div class="text-center">
+                {% if title %}<h1 class="text-4xl font-bold">{{ title }}</h1>{% endif %}
+                {% if subtitle %}<p class="py-6 text-lg">{{ subtitle }}</p>{% endif %}
+                {% if hero.cta_text and hero.cta_link %}
+                <a href="{{ hero.cta_link }}" class="btn btn-primary">
+                    {{ hero.cta_text }}
+                </a>
+                {% endif %}
+            </div>
+        </section>
+        ''')
+
+
+def _hero_render_options(hero_section_cls: type) -> tuple:
+    """Loader options for the relationships read when rendering a hero."""
+    return (
+        joinedload(hero_section_cls.media),
+        joinedload(hero_section_cls.template),
+    )
 
-if TYPE_CHECKING:
-    from v_flask.models import Betreiber
-    from v_flask_plugins.hero.models import HeroSection, HeroTemplate
+
+# Default template query
+_DEFAULT_TEMPLATE_STMT = select(HeroTemplate).where(
+    HeroTemplate.is_default == True,  # noqa: E712
+    HeroTemplate.active == True,  # noqa: E712
+).limit(1)
+
+
+@dataclass(slots=True, frozen=True)
+class HeroPreview:
+    """Unsaved hero data for previews (the attributes hero templates read)."""
+    variant: str
+    cta_text: str | None = None
+    cta_link: str | None = None
+    image_path: str | None = None
 
 
 class HeroService:
@@ -38,31 +134,76 @@ class HeroService:
         preview = service.render_preview('Titel', 'Untertitel')
     """
 
+    # Max. number of rendered heroes kept by render_hero() (LRU)
+    RENDER_CACHE_SIZE = 128
+
     def __init__(self):
         """Initialize the hero service."""
-        self._betreiber: Betreiber | None = None
+        self._render_cache: OrderedDict[tuple, str] = OrderedDict()
+        # The service is shared by all worker threads
+        self._render_cache_lock = threading.Lock()
 
     @property
     def betreiber(self) -> Betreiber | None:
-        """Get cached Betreiber instance.
+        """Get the Betreiber instance, memoized per request.
+
+        Only the columns used for the text context are loaded.
 
         Returns:
             Betreiber instance or None if not configured.
         """
-        if self._betreiber is None:
-            from v_flask.models import Betreiber
-            self._betreiber = db.session.query(Betreiber).first()
-        return self._betreiber
+        if 'hero_betreiber' not in g:
+            g.hero_betreiber = db.session.scalars(
+                select(Betreiber).options(
+                    load_only(
+                        Betreiber.name,
+                        Betreiber.website,
+                        Betreiber.email,
+                        Betreiber.custom_settings,
+                    )
+                ).limit(1)
+            ).first()
+        return g.hero_betreiber
 
     def _build_context(self, extra_context: dict[str, Any] | None = None) -> dict[str, Any]:
         """Build context for template rendering.
 
+        The betreiber part is built once per request and shared, so the
+        returned dict must not be modified.
+
         Args:
             extra_context: Additional context to merge.
 
         Returns:
             Complete context dictionary with betreiber data.
         """
+        if 'hero_context' not in g:
+            g.hero_context = self._build_base_context()
+
+        if not extra_context:
+            return g.hero_context
+        return {**g.hero_context, **extra_context}
+
+    def _context_key(self) -> tuple:
+        """Get a hashable key for the placeholder context, memoized per request.
+
+        Returns:
+            Tuple of the betreiber values and the location fallback.
+        """
+        if 'hero_context_key' not in g:
+            context = self._build_context()
+            g.hero_context_key = (
+                tuple(context.get('betreiber', {}).values()),
+                context['location']['bezeichnung'],
+            )
+        return g.hero_context_key
+
+    def _build_base_context(self) -> dict[str, Any]:
+        """Build the betreiber and default location context.
+
+        Returns:
+            Context dictionary with betreiber data.
+        """
         context = {}
 
         if self.betreiber:
@@ -74,24 +215,20 @@ class HeroService:
             # Also provide 'plattform' for compatibility with existing templates
             context['plattform'] = context['betreiber']
 
-        # Provide fallback for 'location' if not in extra_context
+        # Provide fallback for 'location' (extra_context may override it)
         # This prevents template errors when {{ location.bezeichnung }} is used
         # on pages without a location context (e.g., homepage, contact page)
-        if not extra_context or 'location' not in extra_context:
-            # Get location_bezeichnung from Betreiber settings (configured in admin)
-            location_bezeichnung = 'Lokal'  # Default fallback
-            if self.betreiber:
-                location_bezeichnung = self.betreiber.get_setting(
-                    'location_bezeichnung', 'Lokal'
-                )
-
-            context['location'] = {
-                'bezeichnung': location_bezeichnung,
-                'name': '',
-            }
+        # Get location_bezeichnung from Betreiber settings (configured in admin)
+        location_bezeichnung = 'Lokal'  # Default fallback
+        if self.betreiber:
+            location_bezeichnung = self.betreiber.get_setting(
+                'location_bezeichnung', 'Lokal'
+            )
 
-        if extra_context:
-            context.update(extra_context)
+        context['location'] = {
+            'bezeichnung': location_bezeichnung,
+            'name': '',
+        }
 
         return context
 
@@ -102,11 +239,18 @@ class HeroService:
     def get_active_hero(self) -> HeroSection | None:
         """Get the active hero section.
 
+        Memoized per request, as templates may ask for it several times.
+
         Returns:
             Active HeroSection or None if none configured.
         """
-        from v_flask_plugins.hero.models import HeroSection
-        return HeroSection.query.filter_by(active=True).first()
+        if 'hero_active' not in g:
+            g.hero_active = db.session.scalars(
+                select(HeroSection).options(
+                    *_hero_render_options(HeroSection)
+                ).where(HeroSection.active == True).limit(1)  # noqa: E712
+            ).first()
+        return g.hero_active
 
     def render_active_hero(self, extra_context: dict[str, Any] | None = None) -> str:
         """Render the active hero section as HTML.
@@ -130,6 +274,11 @@ class HeroService:
     ) -> str:
         """Render a specific hero section as HTML.
 
+        For saved heroes without extra_context the HTML is kept in an LRU
+        cache, keyed by the hero's identity and update timestamp, its text
+        template's update timestamp, its media image and the placeholder
+        context.
+
         Args:
             hero: HeroSection instance to render.
             extra_context: Additional context for template rendering.
@@ -137,6 +286,43 @@ class HeroService:
         Returns:
             Rendered HTML string.
         """
+        if extra_context or hero.id is None:
+            # Custom context or unsaved hero: nothing stable to key on
+            return self._render_hero(hero, extra_context)
+
+        template = hero.template if hero.template_id is not None else None
+        media = hero.media if hero.media_id is not None else None
+        key = (
+            hero.id, hero.created_at, hero.updated_at,
+            # Template texts are used when no custom title/subtitle is set
+            template.updated_at if template is not None else None,
+            # Media has no update timestamp; a replaced image changes its
+            # upload time or URL
+            media.uploaded_at if media is not None else None,
+            hero.image_path,
+            # Placeholder values (betreiber data may change between requests)
+            self._context_key(),
+        )
+        cache = self._render_cache
+        with self._render_cache_lock:
+            html = cache.get(key)
+            if html is not None:
+                cache.move_to_end(key)
+                return html
+
+        html = self._render_hero(hero)
+        with self._render_cache_lock:
+            cache[key] = html
+            if len(cache) > self.RENDER_CACHE_SIZE:
+                cache.popitem(last=False)
+        return html
+
+    def _render_hero(
+        self,
+        hero: HeroSection,
+        extra_context: dict[str, Any] | None = None
+    ) -> str:
+        """Render a hero section without caching (see render_hero)."""
         context = self._build_context(extra_context)
 
         # Render title and subtitle (may contain Jinja2 placeholders)
@@ -147,7 +333,6 @@ class HeroService:
         template_path = f'hero/{hero.variant}.html'
 
         try:
-            from flask import render_template
             return render_template(
                 template_path,
                 hero=hero,
@@ -172,42 +357,28 @@ class HeroService:
             return ''
 
         try:
-            return Template(text).render(context)
+            return _render_placeholders(text, context)
         except Exception:
             # Return raw text if rendering fails
             return text
 
     def _render_fallback(
         self,
-        hero: HeroSection,
+        hero: HeroSection | HeroPreview,
         title: str,
         subtitle: str
     ) -> str:
         """Render a fallback hero section if template is missing.
 
         Args:
-            hero: HeroSection instance.
+            hero: HeroSection or HeroPreview.
             title: Rendered title.
             subtitle: Rendered subtitle.
 
         Returns:
             Simple HTML fallback.
         """
-        fallback_html = '''
-        <section class="hero bg-base-200 py-20">
-            <div class="text-center">
-                {% if title %}<h1 class="text-4xl font-bold">{{ title }}</h1>{% endif %}
-                {% if subtitle %}<p class="py-6 text-lg">{{ subtitle }}</p>{% endif %}
-                {% if hero.cta_text and hero.cta_link %}
-                <a href="{{ hero.cta_link }}" class="btn btn-primary">
-                    {{ hero.cta_text }}
-                </a>
-                {% endif %}
-            </div>
-        </section>
-        '''
-        return render_template_string(
-            fallback_html,
+        return _FALLBACK_TEMPLATE.render(
             hero=hero,
             title=title,
             subtitle=subtitle
@@ -226,8 +397,7 @@ class HeroService:
         Returns:
             HeroTemplate or None if not found.
         """
-        from v_flask_plugins.hero.models import HeroTemplate
-        return HeroTemplate.query.get(template_id)
+        return db.session.get(HeroTemplate, template_id)
 
     def get_default_template(self) -> HeroTemplate | None:
         """Get the default HeroTemplate.
@@ -235,8 +405,7 @@ class HeroService:
         Returns:
             Default HeroTemplate or None if none set.
         """
-        from v_flask_plugins.hero.models import HeroTemplate
-        return HeroTemplate.query.filter_by(is_default=True, active=True).first()
+        return db.session.scalars(_DEFAULT_TEMPLATE_STMT).first()
 
     def get_all_templates(self) -> list[HeroTemplate]:
         """Get all active HeroTemplates.
@@ -244,7 +413,6 @@ class HeroService:
         Returns:
             List of active HeroTemplates, default first.
         """
-        from v_flask_plugins.hero.models import HeroTemplate
         return HeroTemplate.query.filter_by(active=True).order_by(
             HeroTemplate.is_default.desc(),
             HeroTemplate.name
@@ -273,8 +441,8 @@ class HeroService:
         context = self._build_context()
 
         try:
-            titel = Template(template.titel).render(context)
-            untertitel = Template(template.untertitel).render(context)
+            titel = _render_placeholders(template.titel, context)
+            untertitel = _render_placeholders(template.untertitel, context)
         except Exception:
             titel = template.titel
             untertitel = template.untertitel
@@ -304,8 +472,8 @@ class HeroService:
         context = self._build_context()
 
         try:
-            rendered_titel = Template(titel).render(context)
-            rendered_untertitel = Template(untertitel).render(context)
+            rendered_titel = _render_placeholders(titel, context)
+            rendered_untertitel = _render_placeholders(untertitel, context)
         except Exception as e:
             return {
                 'titel': f'[Fehler: {e}]',
@@ -336,34 +504,79 @@ class HeroService:
         Returns:
             Rendered HTML string.
         """
-        context = self._build_context()
+        preview = self._build_preview(
+            variant, title, subtitle, cta_text, cta_link, image_path
+        )
 
-        # Render text with placeholders
-        rendered_title = self._render_text(title, context)
-        rendered_subtitle = self._render_text(subtitle, context)
+        try:
+            return render_template(f'hero/{variant}.html', **preview)
+        except Exception:
+            return self._render_fallback(**preview)
 
-        # Create a mock hero object for template
-        class MockHero:
-            pass
+    def stream_hero_preview(
+        self,
+        variant: str,
+        title: str,
+        subtitle: str,
+        cta_text: str | None = None,
+        cta_link: str | None = None,
+        image_path: str | None = None
+    ) -> Iterator[str]:
+        """Render full hero section preview as a stream of HTML chunks.
 
-        mock_hero = MockHero()
-        mock_hero.variant = variant
-        mock_hero.cta_text = cta_text
-        mock_hero.cta_link = cta_link
-        mock_hero.image_path = image_path
+        Same as render_hero_preview(), but the variant template is streamed,
+        so the first bytes are sent before rendering completes. The first
+        chunk is rendered eagerly: if the template is missing or fails to
+        render, the inline fallback markup is returned instead, as in the
+        non-streamed preview.
+
+        Args:
+            variant: Layout variant ('centered', 'split', 'overlay').
+            title: Title text (may contain placeholders).
+            subtitle: Subtitle text (may contain placeholders).
+            cta_text: CTA button text.
+            cta_link: CTA button link.
+            image_path: Background image path.
 
-        template_path = f'hero/{variant}.html'
+        Returns:
+            Iterator of rendered HTML chunks.
+        """
+        preview = self._build_preview(
+            variant, title, subtitle, cta_text, cta_link, image_path
+        )
 
         try:
-            from flask import render_template
-            return render_template(
-                template_path,
-                hero=mock_hero,
-                title=rendered_title,
-                subtitle=rendered_subtitle,
-            )
+            template = current_app.jinja_env.get_template(f'hero/{variant}.html')
+            chunks = stream_template(template, **preview)
+            first = next(chunks, '')
         except Exception:
-            return self._render_fallback(mock_hero, rendered_title, rendered_subtitle)
+            return iter((self._render_fallback(**preview),))
+        return chain((first,), chunks)
+
+    def _build_preview(
+        self,
+        variant: str,
+        title: str,
+        subtitle: str,
+        cta_text: str | None,
+        cta_link: str | None,
+        image_path: str | None
+    ) -> dict[str, Any]:
+        """Build the variant template context for an unsaved hero."""
+        context = self._build_context()
+
+        return {
+            # Stand-in for a HeroSection in the variant template
+            'hero': HeroPreview(
+                variant=variant,
+                cta_text=cta_text,
+                cta_link=cta_link,
+                image_path=image_path,
+            ),
+            # Render text with placeholders
+            'title': self._render_text(title, context),
+            'subtitle': self._render_text(subtitle, context),
+        }
 
     # ==============================================
     # Route-Based Hero Methods (NEW)
@@ -372,11 +585,15 @@ class HeroService:
     def get_all_hero_sections(self) -> list[HeroSection]:
         """Get all hero sections (not just active).
 
+        Media, template and assignments are loaded eagerly for list views.
+
         Returns:
             List of all HeroSection instances.
         """
-        from v_flask_plugins.hero.models import HeroSection
-        return HeroSection.query.order_by(
+        return HeroSection.query.options(
+            *_hero_render_options(HeroSection),
+            selectinload(HeroSection.assignments),
+        ).order_by(
             HeroSection.active.desc(),
             HeroSection.name,
             HeroSection.id
@@ -391,8 +608,10 @@ class HeroService:
         Returns:
             HeroSection or None if not found.
         """
-        from v_flask_plugins.hero.models import HeroSection
-        return db.session.get(HeroSection, section_id)
+        return db.session.get(
+            HeroSection, section_id,
+            options=_hero_render_options(HeroSection)
+        )
 
     def get_hero_for_route(
         self,
@@ -411,17 +630,17 @@ class HeroService:
         Returns:
             HeroSection instance or None if no assignment found.
         """
-        from v_flask_plugins.hero.models import (
-            HeroAssignment,
-            HeroSection,
-            PageRoute,
-        )
-
-        # Find assignment for this endpoint and slot
+        # Find assignment for this endpoint and slot, loading the hero
+        # (with media and template) in the same query
         assignment = (
             db.session.query(HeroAssignment)
             .join(PageRoute)
             .join(HeroSection)
+            .options(
+                contains_eager(HeroAssignment.hero_section).options(
+                    *_hero_render_options(HeroSection)
+                )
+            )
             .filter(
                 PageRoute.endpoint == endpoint,
                 HeroAssignment.slot_position == slot,
@@ -445,7 +664,10 @@ class HeroService:
         """Render hero section for a specific endpoint and slot.
 
         Main method for frontend template integration. Call this from
-        templates to render the assigned hero section.
+        templates to render the assigned hero section. The result is
+        memoized per request and (endpoint, slot); across requests only
+        the render itself is cached (see render_hero), so assignment
+        changes apply immediately in every worker.
 
         Args:
             endpoint: Flask endpoint name (e.g., 'public.index').
@@ -454,24 +676,30 @@ class HeroService:
         Returns:
             Rendered HTML string, or empty string if no hero assigned.
         """
-        hero = self.get_hero_for_route(endpoint, slot)
+        slot_cache = g.setdefault('hero_slot_cache', {})
+        key = (endpoint, slot)
+        if key not in slot_cache:
+            hero = self.get_hero_for_route(endpoint, slot)
+            slot_cache[key] = self.render_hero(hero) if hero else ''
 
-        if not hero:
-            return ''
-
-        return self.render_hero(hero)
+        return slot_cache[key]
 
     def get_assignments_for_hero(self, hero_id: int) -> list:
         """Get all page assignments for a hero section.
 
+        The hero is joined as well, which refreshes it in the same query
+        when a preceding commit has expired it.
+
         Args:
             hero_id: Hero section ID.
 
         Returns:
             List of HeroAssignment instances.
         """
-        from v_flask_plugins.hero.models import HeroAssignment
-        return HeroAssignment.query.filter_by(
+        return HeroAssignment.query.options(
+            joinedload(HeroAssignment.page_route),
+            joinedload(HeroAssignment.hero_section),
+        ).filter_by(
             hero_section_id=hero_id
         ).order_by(HeroAssignment.slot_position).all()
 
@@ -493,12 +721,6 @@ class HeroService:
         Returns:
             Created HeroAssignment or None on error.
         """
-        from v_flask_plugins.hero.models import (
-            HeroAssignment,
-            HeroSection,
-            PageRoute,
-        )
-
         # Verify hero and route exist
         hero = db.session.get(HeroSection, hero_id)
         route = db.session.get(PageRoute, route_id)
@@ -539,8 +761,6 @@ class HeroService:
         Returns:
             True if removed, False if not found.
         """
-        from v_flask_plugins.hero.models import HeroAssignment
-
         assignment = db.session.get(HeroAssignment, assignment_id)
         if assignment:
             db.session.delete(assignment)
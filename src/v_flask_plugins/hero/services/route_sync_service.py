@@ -6,9 +6,13 @@ PageRoute table for hero section assignment.
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import TYPE_CHECKING
 
+from flask import g
+from sqlalchemy import and_, insert, select, update
+
 from v_flask.extensions import db
 
 if TYPE_CHECKING:
@@ -17,6 +21,25 @@ if TYPE_CHECKING:
 from v_flask_plugins.hero.models import PageRoute
 
 
+# Parameter names in URL rules, e.g. <int:id> -> id
+_PARAM_RE = re.compile(r'<(?:[\w:]+:)?(\w+)>')
+
+
+@functools.lru_cache(maxsize=16)
+def parse_excluded_blueprints(raw: str) -> frozenset[str]:
+    """Parse the newline-separated excluded_blueprints setting.
+
+    Cached per raw setting value, so a changed setting is parsed anew.
+
+    Args:
+        raw: Setting value with one blueprint name per line.
+
+    Returns:
+        Frozenset of blueprint names.
+    """
+    return frozenset(line.strip() for line in raw.splitlines() if line.strip())
+
+
 class RouteSyncService:
     """Service for synchronizing Flask routes with PageRoute table.
 
@@ -57,6 +80,9 @@ class RouteSyncService:
         r'^serve_media$',     # Direct media serve route
     ]
 
+    # All exclusion patterns fused into one alternation (single match per endpoint)
+    _EXCLUDED_RE = re.compile('|'.join(f'(?:{p})' for p in EXCLUDED_PATTERNS))
+
     # Endpoints that are clearly not pages
     EXCLUDED_ENDPOINTS = [
         'static',
@@ -77,6 +103,14 @@ class RouteSyncService:
         r'_admin$',     # *_admin (fragebogen_admin, hero_admin, etc.)
     ]
 
+    _ADMIN_RE = re.compile('|'.join(f'(?:{p})' for p in ADMIN_BLUEPRINT_PATTERNS))
+
+    # Display names for special endpoints
+    DISPLAY_NAMES = {
+        'public.index': 'Startseite',
+        'public.slug_handler': 'Inhaltsseiten (Slug)',
+    }
+
     def sync_routes(self, app: Flask) -> dict[str, int]:
         """Scan Flask routes and sync with PageRoute table.
 
@@ -97,73 +131,132 @@ class RouteSyncService:
         current_routes = self._get_flask_routes(app)
         current_endpoints = {r['endpoint'] for r in current_routes}
 
-        # Get existing routes from database
-        existing_routes = {r.endpoint: r for r in PageRoute.query.all()}
-        existing_endpoints = set(existing_routes.keys())
+        # Get existing routes from database (columns only, no ORM objects)
+        existing_routes = {
+            endpoint: (route_id, rule)
+            for route_id, endpoint, rule in db.session.execute(
+                select(PageRoute.id, PageRoute.endpoint, PageRoute.rule)
+            )
+        }
 
-        # Add new routes
+        new_mappings = []
+        update_mappings = []
         for route_data in current_routes:
-            endpoint = route_data['endpoint']
-            if endpoint not in existing_endpoints:
-                page_route = PageRoute(
-                    endpoint=endpoint,
-                    rule=route_data['rule'],
-                    blueprint=route_data['blueprint'],
-                    display_name=route_data['display_name'],
-                    route_type=route_data['route_type'],
-                    hero_assignable=route_data['hero_assignable'],
-                )
-                db.session.add(page_route)
-                stats['added'] += 1
+            existing = existing_routes.get(route_data['endpoint'])
+            if existing is None:
+                new_mappings.append(route_data)
             else:
                 # Update existing route if rule changed
-                existing = existing_routes[endpoint]
-                if existing.rule != route_data['rule']:
-                    existing.rule = route_data['rule']
+                route_id, rule = existing
+                if rule != route_data['rule']:
+                    update_mappings.append({'id': route_id, 'rule': route_data['rule']})
                 stats['unchanged'] += 1
 
-        # Remove routes that no longer exist
-        for endpoint in existing_endpoints - current_endpoints:
-            route = existing_routes[endpoint]
-            db.session.delete(route)
-            stats['removed'] += 1
+        if new_mappings:
+            db.session.execute(insert(PageRoute), new_mappings)
+            stats['added'] = len(new_mappings)
+        if update_mappings:
+            db.session.execute(update(PageRoute), update_mappings)
+
+        # Remove routes that no longer exist. Deleted through the ORM so the
+        # assignment cascades of hero/cta (backrefs on PageRoute) still apply.
+        removed_endpoints = existing_routes.keys() - current_endpoints
+        if removed_endpoints:
+            for route in db.session.scalars(
+                select(PageRoute).where(PageRoute.endpoint.in_(removed_endpoints))
+            ):
+                db.session.delete(route)
+            stats['removed'] = len(removed_endpoints)
 
         db.session.commit()
         return stats
 
+    def get_excluded_blueprints(self) -> frozenset[str]:
+        """Get the blueprints excluded from hero assignment (plugin setting).
+
+        Returns:
+            Frozenset of blueprint names (empty if none configured).
+        """
+        raw = self._route_settings().get('excluded_blueprints') or ''
+        return parse_excluded_blueprints(raw) if raw else frozenset()
+
+    def _route_settings(self) -> dict:
+        """Load the hero plugin settings in one query, memoized per request.
+
+        Returns:
+            Dict of setting key -> converted value (missing keys omitted).
+        """
+        if 'hero_route_settings' not in g:
+            from v_flask.models import PluginConfig
+
+            g.hero_route_settings = PluginConfig.get_plugin_settings('hero')
+        return g.hero_route_settings
+
     def get_assignable_routes(self) -> list[PageRoute]:
         """Get all routes available for hero assignment.
 
         Applies filtering based on plugin settings:
-        - excluded_blueprints: Comma-separated list of blueprints to exclude
+        - excluded_blueprints: Newline-separated list of blueprints to exclude
         - show_only_public: If true, only show routes with route_type='page'
 
         Returns:
             List of PageRoute instances that can have hero sections.
         """
-        from v_flask.models import PluginConfig
+        return self._assignable_query(PageRoute.query).order_by(
+            PageRoute.blueprint,
+            PageRoute.display_name
+        ).all()
 
-        query = PageRoute.query.filter_by(hero_assignable=True)
+    def get_unassigned_routes(self, hero_id: int) -> list[PageRoute]:
+        """Get assignable routes the given hero is not yet assigned to.
 
-        # Apply blueprint exclusions from plugin settings
-        excluded_str = PluginConfig.get_value('hero', 'excluded_blueprints', '')
-        if excluded_str:
-            excluded_blueprints = [
-                bp.strip() for bp in excluded_str.split('\n') if bp.strip()
-            ]
-            for bp in excluded_blueprints:
-                query = query.filter(PageRoute.blueprint != bp)
+        Filters via anti-join against the hero's assignments, so the
+        assigned route IDs never have to be loaded.
 
-        # Optionally filter to only public pages
-        show_only_public = PluginConfig.get_value('hero', 'show_only_public', True)
-        if show_only_public:
-            query = query.filter(PageRoute.route_type == 'page')
+        Args:
+            hero_id: Hero section ID.
+
+        Returns:
+            List of assignable PageRoute instances without this hero.
+        """
+        from v_flask_plugins.hero.models import HeroAssignment
+
+        query = PageRoute.query.outerjoin(
+            HeroAssignment,
+            and_(
+                HeroAssignment.page_route_id == PageRoute.id,
+                HeroAssignment.hero_section_id == hero_id,
+            )
+        ).filter(HeroAssignment.id.is_(None))
 
-        return query.order_by(
+        return self._assignable_query(query).order_by(
             PageRoute.blueprint,
             PageRoute.display_name
         ).all()
 
+    def _assignable_query(self, query):
+        """Apply the hero_assignable flag and plugin setting filters.
+
+        Args:
+            query: PageRoute query to filter.
+
+        Returns:
+            Filtered query.
+        """
+        query = query.filter(PageRoute.hero_assignable == True)  # noqa: E712
+
+        # Apply blueprint exclusions from plugin settings
+        excluded_blueprints = self.get_excluded_blueprints()
+        if excluded_blueprints:
+            query = query.filter(PageRoute.blueprint.notin_(excluded_blueprints))
+
+        # Optionally filter to only public pages
+        show_only_public = self._route_settings().get('show_only_public')
+        if show_only_public is None or show_only_public:
+            query = query.filter(PageRoute.route_type == 'page')
+
+        return query
+
     def get_public_routes(self) -> list[PageRoute]:
         """Get only public (non-admin) routes.
 
@@ -173,21 +266,15 @@ class RouteSyncService:
         Returns:
             List of PageRoute instances for public pages.
         """
-        from v_flask.models import PluginConfig
-
         query = PageRoute.query.filter(
             PageRoute.hero_assignable == True,  # noqa: E712
             PageRoute.route_type == 'page'
         )
 
         # Apply blueprint exclusions from plugin settings
-        excluded_str = PluginConfig.get_value('hero', 'excluded_blueprints', '')
-        if excluded_str:
-            excluded_blueprints = [
-                bp.strip() for bp in excluded_str.split('\n') if bp.strip()
-            ]
-            for bp in excluded_blueprints:
-                query = query.filter(PageRoute.blueprint != bp)
+        excluded_blueprints = self.get_excluded_blueprints()
+        if excluded_blueprints:
+            query = query.filter(PageRoute.blueprint.notin_(excluded_blueprints))
 
         return query.order_by(PageRoute.display_name).all()
 
@@ -255,9 +342,8 @@ class RouteSyncService:
             return self.ROUTE_TYPES[blueprint]
 
         # Check admin patterns
-        for pattern in self.ADMIN_BLUEPRINT_PATTERNS:
-            if re.search(pattern, blueprint):
-                return 'admin'
+        if self._ADMIN_RE.search(blueprint):
+            return 'admin'
 
         return 'page'
 
@@ -270,10 +356,7 @@ class RouteSyncService:
         Returns:
             True if endpoint should be excluded.
         """
-        for pattern in self.EXCLUDED_PATTERNS:
-            if re.search(pattern, endpoint):
-                return True
-        return False
+        return self._EXCLUDED_RE.search(endpoint) is not None
 
     def _generate_display_name(self, endpoint: str, rule: str) -> str:
         """Generate human-readable display name for route.
@@ -286,13 +369,8 @@ class RouteSyncService:
             Human-readable name for admin UI.
         """
         # Special cases
-        display_names = {
-            'public.index': 'Startseite',
-            'public.slug_handler': 'Inhaltsseiten (Slug)',
-        }
-
-        if endpoint in display_names:
-            return display_names[endpoint]
+        if endpoint in self.DISPLAY_NAMES:
+            return self.DISPLAY_NAMES[endpoint]
 
         # Extract meaningful part
         if '.' in endpoint:
@@ -306,7 +384,7 @@ class RouteSyncService:
         # Add context from rule if dynamic
         if '<' in rule:
             # Extract parameter names
-            params = re.findall(r'<(?:[\w:]+:)?(\w+)>', rule)
+            params = _PARAM_RE.findall(rule)
             if params:
                 param_str = ', '.join(p.title() for p in params[:2])
                 name = f'{name} ({param_str})'
@@ -1,5 +1,6 @@
 """Tests for the Fragebogen plugin."""
 
+import json
 import pytest
 import secrets
 from datetime import datetime, timedelta
@@ -13,7 +14,8 @@ from v_flask_plugins.fragebogen.models import (
     FragebogenStatus, TeilnahmeStatus
 )
 from v_flask_plugins.fragebogen.services import (
-    FragebogenService, ValidationResult, get_fragebogen_service
+    FragebogenService, ValidationResult, get_fragebogen_service,
+    TeilnehmerResolver
 )
 
 
@@ -86,6 +88,41 @@ INVALID_SCHEMA_EMPTY_PAGES = {
 }
 
 
+PREFILL_V2_SCHEMA = {
+    "version": 2,
+    "seiten": [
+        {
+            "id": "s1",
+            "titel": "Kontakt",
+            "fragen": [
+                {"id": "firma", "typ": "text", "frage": "Firma", "prefill": "kunde.firmierung"},
+                {"id": "email", "typ": "text", "frage": "E-Mail", "prefill": "teilnehmer.email"},
+                {"id": "fax", "typ": "text", "frage": "Fax", "prefill": "kunde.fax"},
+                {"id": "bemerkung", "typ": "text", "frage": "Bemerkung"}
+            ]
+        }
+    ]
+}
+
+
+class DictTeilnehmerResolver(TeilnehmerResolver):
+    """Resolver serving prefill values from a dict and counting lookups."""
+
+    def __init__(self, values):
+        self.values = values
+        self.prefill_calls = 0
+
+    def get_email(self, teilnehmer_id, teilnehmer_typ):
+        return self.values.get('teilnehmer.email')
+
+    def get_name(self, teilnehmer_id, teilnehmer_typ):
+        return self.values.get('kunde.firmierung')
+
+    def get_prefill_value(self, teilnehmer_id, teilnehmer_typ, prefill_key):
+        self.prefill_calls += 1
+        return self.values.get(prefill_key)
+
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
@@ -259,6 +296,21 @@ class TestFragebogenModel:
             assert 'feedback' in frage_ids
             assert 'empfehlung' in frage_ids
 
+    def test_fragebogen_fragen_cached(self, app_with_plugin, fragebogen):
+        """Test that fragen is cached until the definition is replaced."""
+        with app_with_plugin.app_context():
+            fb = Fragebogen.query.get(fragebogen.id)
+            fragen = fb.fragen
+            assert fb.fragen is fragen
+
+            fb.definition_json = {
+                "version": 2,
+                "seiten": [{"id": "s1", "titel": "Neu", "fragen": [
+                    {"id": "neu", "typ": "text", "frage": "Neu?"}
+                ]}]
+            }
+            assert [f['id'] for f in fb.fragen] == ['neu']
+
     def test_fragebogen_anzahl_fragen(self, app_with_plugin, fragebogen):
         """Test question count property."""
         with app_with_plugin.app_context():
@@ -530,6 +582,55 @@ class TestFragebogenServiceValidation:
         assert result.valid is False
         assert any('optionen' in e.lower() for e in result.errors)
 
+    def test_validate_type_specific_fields(self, fragebogen_service):
+        """Test type-specific validation for skala, number, group and table."""
+        schema = {
+            "version": 2,
+            "seiten": [
+                {
+                    "id": "s1",
+                    "titel": "Page 1",
+                    "fragen": [
+                        {"id": "q1", "typ": "skala", "frage": "Rate", "min": 5, "max": 1},
+                        {"id": "q2", "typ": "number", "frage": "Count", "min": "a", "max": "b"},
+                        {"id": "q3", "typ": "group", "fields": []},
+                        {"id": "q4", "typ": "table", "frage": "Matrix"},
+                        {"id": "q5", "typ": "dropdown", "frage": "Pick", "optionen": ["A", "B"]},
+                    ]
+                }
+            ]
+        }
+        result = fragebogen_service.validate_definition(schema)
+        assert result.valid is False
+        assert result.errors == [
+            'Seite 1, Frage 1: "min" muss kleiner als "max" sein',
+            'Seite 1, Frage 2: "min" muss eine Zahl sein',
+            'Seite 1, Frage 2: "max" muss eine Zahl sein',
+            'Seite 1, Frage 3: Mindestens ein Feld in "fields" erforderlich',
+            'Seite 1, Frage 4: Feld "columns" fehlt für table',
+        ]
+
+    def test_validate_page_and_show_if_errors(self, fragebogen_service):
+        """Test error messages are prefixed with page and question position."""
+        schema = {
+            "version": 2,
+            "seiten": [
+                {"id": "s1", "fragen": [{"id": "q1", "typ": "text", "frage": "Name"}]},
+                {
+                    "id": "s2",
+                    "titel": "Page 2",
+                    "fragen": [
+                        {"id": "q2", "typ": "text", "frage": "Why", "show_if": {"equals": True}}
+                    ]
+                }
+            ]
+        }
+        result = fragebogen_service.validate_definition(schema)
+        assert result.errors == [
+            'Seite 1: Feld "titel" fehlt',
+            'Seite 2, Frage 1: "show_if.frage_id" fehlt',
+        ]
+
 
 class TestFragebogenServiceCRUD:
     """Tests for FragebogenService CRUD operations."""
@@ -658,6 +759,514 @@ class TestFragebogenServiceTeilnahme:
             assert t.kontakt_name == 'Test User'
             assert t.kontakt_zusatz['firma'] == 'Test GmbH'
 
+    def test_magic_url_base(self, app_with_plugin, fragebogen_service, teilnahme):
+        """Test that the magic-link base plus token resolves to the wizard URL."""
+        from flask import url_for
+        with app_with_plugin.test_request_context():
+            t = FragebogenTeilnahme.query.get(teilnahme.id)
+            base = fragebogen_service._get_magic_url_base()
+
+            assert base + t.token == url_for(
+                'fragebogen_public.wizard', token=t.token, _external=True
+            )
+
+
+class TestFragebogenServiceCompletion:
+    """Tests for FragebogenService completion checks."""
+
+    def test_complete_teilnahme_missing_pflicht(self, app_with_plugin, fragebogen_service, teilnahme):
+        """Test that unanswered required questions block completion."""
+        with app_with_plugin.app_context():
+            t = FragebogenTeilnahme.query.get(teilnahme.id)
+            fragebogen_service.save_antwort(t, 'name', {'value': 'Test'})
+
+            with pytest.raises(ValueError, match='Pflichtfragen'):
+                fragebogen_service.complete_teilnahme(t)
+
+            assert t.is_abgeschlossen is False
+
+    def test_complete_teilnahme(self, app_with_plugin, fragebogen_service, teilnahme):
+        """Test completing with all required questions answered."""
+        with app_with_plugin.app_context():
+            t = FragebogenTeilnahme.query.get(teilnahme.id)
+            fragebogen_service.save_antwort(t, 'name', {'value': 'Test'})
+            fragebogen_service.save_antwort(t, 'zufriedenheit', {'value': 4})
+            fragebogen_service.save_antwort(t, 'empfehlung', {'value': True})
+
+            assert fragebogen_service.complete_teilnahme(t) is True
+            assert t.is_abgeschlossen is True
+
+    def test_complete_teilnahme_show_if(self, app_with_plugin, fragebogen_service, test_user):
+        """Test that hidden required questions (show_if) are not enforced."""
+        with app_with_plugin.app_context():
+            fb = Fragebogen(
+                titel='Bedingter Fragebogen',
+                definition_json={
+                    "version": 2,
+                    "seiten": [{
+                        "id": "s1",
+                        "titel": "Seite 1",
+                        "fragen": [
+                            {"id": "kunde", "typ": "ja_nein", "frage": "Kunde?", "pflicht": True},
+                            {
+                                "id": "seit", "typ": "text", "frage": "Seit wann?", "pflicht": True,
+                                "show_if": {"frage_id": "kunde", "equals": True}
+                            },
+                            {
+                                "id": "grund", "typ": "text", "frage": "Warum nicht?", "pflicht": True,
+                                "show_if": {"frage_id": "kunde", "not_equals": True}
+                            },
+                        ]
+                    }]
+                },
+                status=FragebogenStatus.AKTIV.value,
+                erstellt_von_id=test_user.id
+            )
+            db.session.add(fb)
+            db.session.commit()
+            t = FragebogenTeilnahme.create_anonymous(fb.id)
+            t.kontakt_email = 'anonym@example.com'
+            t.kontakt_name = 'Anonym'
+            db.session.add(t)
+            db.session.commit()
+
+            fragebogen_service.save_antwort(t, 'kunde', {'value': True})
+            with pytest.raises(ValueError, match='Seit wann'):
+                fragebogen_service.complete_teilnahme(t)
+
+            fragebogen_service.save_antwort(t, 'seit', {'value': '2020'})
+            assert fragebogen_service.complete_teilnahme(t) is True
+
+    def test_is_frage_visible(self):
+        """Test one-off show_if evaluation."""
+        is_visible = FragebogenService._is_frage_visible
+        frage = {'id': 'q2', 'show_if': {'frage_id': 'q1', 'is_not_set': True}}
+
+        assert is_visible({'id': 'q1'}, {}) is True
+        assert is_visible(frage, {}) is True
+        assert is_visible(frage, {'q1': ''}) is True
+        assert is_visible(frage, {'q1': 'x'}) is False
+
+        frage = {'id': 'q3', 'show_if': {'frage_id': 'q1', 'equals': ['a', 'b']}}
+        assert is_visible(frage, {'q1': ['a', 'b']}) is True
+        assert is_visible(frage, {'q1': ['a']}) is False
+
+    def test_visibility_checks_cached_per_definition(self, app_with_plugin, fragebogen):
+        """Test that compiled show_if predicates are reused until the definition changes."""
+        from v_flask_plugins.fragebogen.services.fragebogen_service import (
+            get_visibility_checks
+        )
+        with app_with_plugin.app_context():
+            fb = Fragebogen.query.get(fragebogen.id)
+            checks = get_visibility_checks(fb)
+
+            assert get_visibility_checks(fb) is checks
+            assert set(checks) == {'name', 'zufriedenheit', 'feedback', 'empfehlung'}
+
+            definition = json.loads(json.dumps(VALID_V2_SCHEMA))
+            definition['seiten'][1]['fragen'][0]['show_if'] = {
+                'frage_id': 'empfehlung', 'is_set': True
+            }
+            fb.definition_json = definition
+
+            recompiled = get_visibility_checks(fb)
+            assert recompiled is not checks
+            assert recompiled['feedback']({}) is False
+            assert recompiled['feedback']({'empfehlung': True}) is True
+
+
+class TestFragebogenServicePrefill:
+    """Tests for FragebogenService prefill resolution."""
+
+    def test_get_prefill_data(self, app_with_plugin, test_user):
+        """Test that snapshot and initial answers come from one resolver walk."""
+        with app_with_plugin.app_context():
+            resolver = DictTeilnehmerResolver({
+                'kunde.firmierung': 'Muster GmbH',
+                'teilnehmer.email': 'info@muster.de',
+            })
+            service = FragebogenService(teilnehmer_resolver=resolver)
+            fb = Fragebogen(
+                titel='Prefill',
+                definition_json=PREFILL_V2_SCHEMA,
+                status=FragebogenStatus.AKTIV.value,
+                erstellt_von_id=test_user.id
+            )
+            db.session.add(fb)
+            db.session.commit()
+            t = FragebogenTeilnahme.create_for_teilnehmer(fb.id, 7, 'kunde')
+            db.session.add(t)
+            db.session.commit()
+
+            prefill_values, initial = service.get_prefill_data(fb, t)
+
+            assert resolver.prefill_calls == 3
+            assert prefill_values == {
+                'kunde.firmierung': 'Muster GmbH',
+                'teilnehmer.email': 'info@muster.de',
+                'kunde.fax': None,
+            }
+            assert initial == {
+                'firma': {'value': 'Muster GmbH'},
+                'email': {'value': 'info@muster.de'},
+            }
+            assert service.get_initial_antworten(fb, t) == initial
+
+            anonym = FragebogenTeilnahme.create_anonymous(fb.id)
+            assert service.get_prefill_data(fb, anonym) == ({}, {})
+
+    def test_save_antwort_creates_prefill_snapshot(self, app_with_plugin, test_user):
+        """Test that starting via save_antwort stores the prefill snapshot."""
+        with app_with_plugin.app_context():
+            resolver = DictTeilnehmerResolver({'kunde.firmierung': 'Muster GmbH'})
+            service = FragebogenService(teilnehmer_resolver=resolver)
+            fb = Fragebogen(
+                titel='Prefill',
+                definition_json=PREFILL_V2_SCHEMA,
+                status=FragebogenStatus.AKTIV.value,
+                erstellt_von_id=test_user.id
+            )
+            db.session.add(fb)
+            db.session.commit()
+            t = FragebogenTeilnahme.create_for_teilnehmer(fb.id, 7, 'kunde')
+            db.session.add(t)
+            db.session.commit()
+
+            service.save_antwort(t, 'firma', {'value': 'Neue GmbH'})
+            db.session.expire_all()
+
+            assert t.is_gestartet is True
+            assert t.prefill_snapshot_json['kunde.firmierung'] == 'Muster GmbH'
+            assert t.get_geaenderte_felder() == [{
+                'frage_id': 'firma',
+                'prefill_key': 'kunde.firmierung',
+                'original': 'Muster GmbH',
+                'neu': 'Neue GmbH'
+            }]
+
+    def test_start_teilnahme_reuses_prefill_data(self, app_with_plugin, test_user):
+        """Test the wizard start snapshots the values used for the form."""
+        with app_with_plugin.app_context():
+            resolver = DictTeilnehmerResolver({'kunde.firmierung': 'Muster GmbH'})
+            service = FragebogenService(teilnehmer_resolver=resolver)
+            fb = Fragebogen(
+                titel='Prefill',
+                definition_json=PREFILL_V2_SCHEMA,
+                status=FragebogenStatus.AKTIV.value,
+                erstellt_von_id=test_user.id
+            )
+            db.session.add(fb)
+            db.session.commit()
+            t = FragebogenTeilnahme.create_for_teilnehmer(fb.id, 7, 'kunde')
+            db.session.add(t)
+            db.session.commit()
+
+            prefill_values, initial = service.get_prefill_data(fb, t)
+            service.start_teilnahme(t, prefill_values)
+            db.session.commit()
+
+            assert resolver.prefill_calls == 3
+            assert t.is_gestartet is True
+            assert t.prefill_snapshot_json['kunde.firmierung'] == 'Muster GmbH'
+            assert initial == {'firma': {'value': 'Muster GmbH'}}
+
+    def test_bulk_create_prefill_snapshots(self, app_with_plugin, test_user):
+        """Test snapshots of many participations are refreshed in one go."""
+        with app_with_plugin.app_context():
+            resolver = DictTeilnehmerResolver({'kunde.firmierung': 'Muster GmbH'})
+            service = FragebogenService(teilnehmer_resolver=resolver)
+            fb = Fragebogen(
+                titel='Prefill',
+                definition_json=PREFILL_V2_SCHEMA,
+                status=FragebogenStatus.AKTIV.value,
+                erstellt_von_id=test_user.id
+            )
+            db.session.add(fb)
+            db.session.commit()
+            teilnahmen = [
+                FragebogenTeilnahme.create_for_teilnehmer(fb.id, kunde_id, 'kunde')
+                for kunde_id in (1, 2)
+            ]
+            db.session.add_all(teilnahmen + [FragebogenTeilnahme.create_anonymous(fb.id)])
+            db.session.commit()
+
+            assert service.bulk_create_prefill_snapshots(fb) == 2
+            db.session.expire_all()
+            assert all(
+                t.prefill_snapshot_json['kunde.firmierung'] == 'Muster GmbH'
+                for t in teilnahmen
+            )
+            assert service.bulk_create_prefill_snapshots(fb) == 0
+
+            resolver.values['kunde.firmierung'] = 'Neue GmbH'
+            assert service.bulk_create_prefill_snapshots(fb, teilnahmen[:1]) == 1
+
+    def test_bulk_create_prefill_snapshots_query_count(self, app_with_plugin, test_user):
+        """Test participants and their prefill columns are loaded in one query."""
+        from sqlalchemy import event
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+        from v_flask_plugins.fragebogen.services.fragebogen_service import (
+            DynamicTeilnehmerResolverAdapter
+        )
+        with app_with_plugin.app_context():
+            db.session.add(ParticipantSourceConfig(
+                model_path='v_flask.models.User',
+                display_name='Benutzer',
+                field_mapping={'email': 'email', 'name': 'nachname'},
+            ))
+            users = [
+                User(
+                    email=f'user{i}@example.com',
+                    vorname=f'Vorname{i}',
+                    nachname='User',
+                    rolle_id=test_user.rolle_id,
+                    aktiv=True
+                )
+                for i in range(5)
+            ]
+            for user in users:
+                user.set_password('testpass')
+            fb = Fragebogen(
+                titel='Prefill',
+                definition_json={
+                    "version": 2,
+                    "seiten": [{
+                        "id": "s1",
+                        "titel": "Kontakt",
+                        "fragen": [
+                            {"id": "vorname", "typ": "text", "frage": "Vorname", "prefill": "user.vorname"},
+                            {"id": "aktiv", "typ": "ja_nein", "frage": "Aktiv?", "prefill": "user.aktiv"},
+                        ]
+                    }]
+                },
+                status=FragebogenStatus.AKTIV.value,
+                erstellt_von_id=test_user.id
+            )
+            db.session.add_all(users + [fb])
+            db.session.commit()
+            db.session.add_all([
+                FragebogenTeilnahme.create_for_teilnehmer(fb.id, user.id, 'user')
+                for user in users
+            ])
+            db.session.commit()
+
+            service = FragebogenService(teilnehmer_resolver=DynamicTeilnehmerResolverAdapter())
+            teilnahmen = FragebogenTeilnahme.query.filter_by(fragebogen_id=fb.id).all()
+            assert fb.fragen_mit_prefill
+            # Start from a session without the freshly created users
+            for user in users:
+                db.session.expunge(user)
+
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            event.listen(db.engine, 'before_cursor_execute', listener)
+            try:
+                assert service.bulk_create_prefill_snapshots(fb, teilnahmen) == 5
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', listener)
+
+            # Config lookup, participant IN query, batched UPDATE
+            assert len(statements) == 3
+            assert teilnahmen[0].prefill_snapshot_json == {
+                'user.vorname': 'Vorname0', 'user.aktiv': True
+            }
+
+
+class TestDynamicParticipantResolver:
+    """Tests for the ParticipantSourceConfig based resolver."""
+
+    @pytest.fixture
+    def resolver(self, app_with_plugin):
+        """Resolver with the core User model as participant source."""
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+        from v_flask_plugins.fragebogen.services import DynamicParticipantResolver
+        with app_with_plugin.app_context():
+            db.session.add(ParticipantSourceConfig(
+                model_path='v_flask.models.User',
+                display_name='Benutzer',
+                field_mapping={
+                    'email': 'email',
+                    'name': {'fields': ['vorname', 'nachname'], 'separator': ' '},
+                },
+                greeting_template='Hallo {{ name }}'
+            ))
+            db.session.commit()
+            yield DynamicParticipantResolver()
+
+    def test_get_email_and_name(self, app_with_plugin, resolver, test_user):
+        """Test simple and composite field mappings."""
+        with app_with_plugin.app_context():
+            assert resolver.get_email(test_user.id, 'user') == 'test@example.com'
+            assert resolver.get_name(test_user.id, 'user') == 'Test User'
+
+    def test_config_cache_ttl(self, app_with_plugin, resolver, test_user):
+        """Test config lookups (and misses) are cached until the TTL expires."""
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+
+        with app_with_plugin.app_context():
+            config = resolver._get_config('user')
+            assert resolver._get_config('user') is config
+            assert resolver._get_config('unbekannt') is None
+            assert 'unbekannt' in resolver._config_cache
+
+            # A passed config skips the lookup entirely
+            resolver._config_cache.clear()
+            assert resolver.get_email(test_user.id, 'user', config=config) == 'test@example.com'
+            assert 'user' not in resolver._config_cache
+
+            resolver.config_ttl = 0
+            resolver._get_config('user')
+            ParticipantSourceConfig.query.delete()
+            db.session.commit()
+            assert resolver._get_config('user') is None
+            assert resolver.get_email(test_user.id, 'unbekannt') is None
+            assert resolver.get_email(9999, 'user') is None
+
+    def test_get_greeting(self, app_with_plugin, resolver, test_user):
+        """Test greeting rendered from the configured template."""
+        with app_with_plugin.app_context():
+            assert resolver.get_greeting(test_user.id, 'user') == 'Hallo Test User'
+            assert resolver.get_greeting(9999, 'user') == 'Hallo'
+            assert resolver.get_greeting(test_user.id, 'unbekannt') is None
+
+    def test_get_field_value(self):
+        """Test single and composite field specs, including missing attributes."""
+        from types import SimpleNamespace
+        from v_flask_plugins.fragebogen.services import get_field_value
+
+        kunde = SimpleNamespace(vorname='Max', nachname='Mustermann', titel='', plz=12345)
+
+        assert get_field_value(kunde, 'plz') == '12345'
+        assert get_field_value(kunde, 'fehlt') is None
+        assert get_field_value(kunde, 'a.b') is None
+        assert get_field_value(None, 'plz') is None
+        assert get_field_value(kunde, 42) is None
+        assert get_field_value(kunde, {'fields': ['titel', 'vorname', 'nachname']}) == 'Max Mustermann'
+        assert get_field_value(kunde, {'fields': ['nachname', 'fehlt'], 'separator': ', '}) == 'Mustermann'
+        assert get_field_value(kunde, {'fields': ['vorname']}) == 'Max'
+        assert get_field_value(kunde, {'fields': []}) is None
+
+    def test_load_model_class(self):
+        """Test model loading by import path and error handling."""
+        from v_flask_plugins.fragebogen.services import ModelLoadError, load_model_class
+
+        assert load_model_class('v_flask.models.User') is User
+        with pytest.raises(ModelLoadError):
+            load_model_class('v_flask.models.GibtEsNicht')
+        with pytest.raises(ModelLoadError):
+            load_model_class('ohnepunkt')
+
+    def test_compiled_greeting(self):
+        """Test the greeting template is compiled once per template text."""
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+
+        config = ParticipantSourceConfig(greeting_template='Hallo {{ name }}')
+        compiled = config.compiled_greeting
+        assert compiled.render(name='Max') == 'Hallo Max'
+        assert config.compiled_greeting is compiled
+
+        config.greeting_template = 'Moin {{ name }}'
+        assert config.compiled_greeting.render(name='Max') == 'Moin Max'
+
+        config.greeting_template = None
+        assert config.compiled_greeting is None
+
+    def test_compiled_field_getters(self):
+        """Test the field mapping is compiled once per mapping."""
+        from types import SimpleNamespace
+        from v_flask_plugins.fragebogen.models import ParticipantSourceConfig
+
+        kunde = SimpleNamespace(mail='a@b.de', vorname='Max', nachname='Mustermann')
+        config = ParticipantSourceConfig(field_mapping={
+            'email': 'mail',
+            'name': {'fields': ['vorname', 'nachname']},
+            'titel': '',
+        })
+        getters = config.compiled_field_getters
+        assert getters['email'](kunde) == 'a@b.de'
+        assert getters['name'](kunde) == 'Max Mustermann'
+        assert 'titel' not in getters
+        assert config.compiled_field_getters is getters
+
+        config.field_mapping = {'email': 'vorname'}
+        assert config.compiled_field_getters['email'](kunde) == 'Max'
+
+    def test_generate_greeting(self):
+        """Test standalone greeting with default format and custom template."""
+        from v_flask_plugins.fragebogen.services import generate_greeting
+
+        assert generate_greeting('Herr', 'Dr.', 'Müller') == 'Sehr geehrter Herr Dr. Müller'
+        assert generate_greeting(None, None, 'Meier') == 'Guten Tag Meier'
+        assert generate_greeting(None, None, None) == 'Guten Tag'
+        template = 'Liebe{{ "r" if anrede == "Herr" }} {{ name }}'
+        assert generate_greeting('Herr', None, 'Max', template) == 'Lieber Max'
+        assert generate_greeting('Frau', None, 'Eva', template) == 'Liebe Eva'
+
+    def test_get_prefill_values(self, app_with_plugin, resolver, test_user):
+        """Test batched prefill resolution loads the participant once."""
+        with app_with_plugin.app_context():
+            loads = []
+            load_instance = resolver._load_instance
+
+            def counting_load_instance(*args):
+                loads.append(args)
+                return load_instance(*args)
+
+            resolver._load_instance = counting_load_instance
+            values = resolver.get_prefill_values(
+                test_user.id, 'user',
+                ['user.email', 'teilnehmer.name', 'user.vorname', 'kunde.email', 'ungueltig']
+            )
+
+            assert len(loads) == 1
+            assert values == {
+                'user.email': 'test@example.com',
+                'teilnehmer.name': 'Test User',
+                'user.vorname': 'Test',
+                'kunde.email': None,
+                'ungueltig': None,
+            }
+            assert resolver.get_prefill_value(test_user.id, 'user', 'user.vorname') == 'Test'
+
+    def test_get_instance_loads_mapped_columns_only(self, app_with_plugin, resolver, test_user):
+        """Test participant loads defer columns not needed for resolution."""
+        from sqlalchemy import inspect as sa_inspect
+
+        with app_with_plugin.app_context():
+            user_id = test_user.id
+            db.session.expunge_all()
+
+            instance = resolver._get_instance(user_id, 'user', ('aktiv',))
+            unloaded = sa_inspect(instance).unloaded
+
+            assert {'email', 'vorname', 'nachname', 'aktiv'}.isdisjoint(unloaded)
+            assert 'password_hash' in unloaded
+            assert resolver.get_email(user_id, 'user') == 'test@example.com'
+
+    def test_singleton_reset_clears_cache(self, app_with_plugin, resolver):
+        """Test the shared resolver is built once and reset clears its caches."""
+        from v_flask_plugins.fragebogen.services import (
+            get_dynamic_participant_resolver, reset_dynamic_participant_resolver
+        )
+
+        with app_with_plugin.app_context():
+            shared = get_dynamic_participant_resolver()
+            assert get_dynamic_participant_resolver() is shared
+
+            shared._get_config('user')
+            reset_dynamic_participant_resolver()
+            assert shared._config_cache == {}
+
+    def test_get_instances(self, app_with_plugin, resolver, test_user):
+        """Test bulk loading participants by primary key."""
+        with app_with_plugin.app_context():
+            instances = resolver.get_instances([test_user.id, test_user.id, 99999], 'user')
+
+            assert list(instances) == [test_user.id]
+            assert instances[test_user.id].email == 'test@example.com'
+            assert resolver.get_instances([], 'user') == {}
+            assert resolver.get_instances([test_user.id], 'unbekannt') == {}
+
 
 class TestFragebogenServiceStatistics:
     """Tests for FragebogenService statistics."""
@@ -684,6 +1293,84 @@ class TestFragebogenServiceStatistics:
             assert 'fragen' in stats
             assert stats['teilnehmer_abgeschlossen'] >= 1
 
+    def test_get_auswertung_only_abgeschlossen(self, app_with_plugin, fragebogen_service, active_fragebogen, teilnahme):
+        """Test that only answers of completed participations are evaluated."""
+        with app_with_plugin.app_context():
+            fb = Fragebogen.query.get(active_fragebogen.id)
+            t = FragebogenTeilnahme.query.get(teilnahme.id)
+            fragebogen_service.save_antwort(t, 'zufriedenheit', {'value': 4})
+            t.abschliessen()
+            db.session.commit()
+
+            offen = FragebogenTeilnahme.create_anonymous(fb.id)
+            db.session.add(offen)
+            db.session.commit()
+            fragebogen_service.save_antwort(offen, 'zufriedenheit', {'value': 1})
+
+            stats = fragebogen_service.get_auswertung(fb)
+            fragen = {f['id']: f for f in stats['fragen']}
+
+            assert stats['teilnehmer_gesamt'] == 2
+            assert stats['teilnehmer_abgeschlossen'] == 1
+            assert fragen['zufriedenheit']['antworten_count'] == 1
+            assert fragen['zufriedenheit']['statistik']['verteilung'] == {'4': 1}
+            assert fragen['name']['antworten_count'] == 0
+
+    def test_get_abgeschlossene_antworten_buckets(self, app_with_plugin, fragebogen_service, active_fragebogen, teilnahme):
+        """Test answers are bucketed per requested question only."""
+        with app_with_plugin.app_context():
+            fb = Fragebogen.query.get(active_fragebogen.id)
+            t = FragebogenTeilnahme.query.get(teilnahme.id)
+            db.session.add_all([
+                FragebogenAntwort(teilnahme_id=t.id, frage_id='zufriedenheit', antwort_json={'value': 5}),
+                FragebogenAntwort(teilnahme_id=t.id, frage_id='entfernt', antwort_json={'value': 'alt'}),
+            ])
+            t.abschliessen()
+            db.session.commit()
+
+            answers = fragebogen_service._get_abgeschlossene_antworten(
+                fb, ['zufriedenheit', 'name']
+            )
+
+            assert answers == {'zufriedenheit': [5], 'name': []}
+            assert fragebogen_service._get_abgeschlossene_antworten(fb, []) == {}
+
+    def test_calculate_statistik_verteilung(self, fragebogen_service):
+        """Test answer distribution for choice questions."""
+        stats = fragebogen_service._calculate_frage_statistik(
+            'single_choice', ['A', 'B', 'A', True]
+        )
+        assert stats == {'typ': 'verteilung', 'werte': {'A': 2, 'B': 1, 'True': 1}}
+
+        stats = fragebogen_service._calculate_frage_statistik(
+            'multiple_choice', [['A', 'B'], ['A'], 'ungueltig']
+        )
+        assert stats == {'typ': 'verteilung_mehrfach', 'werte': {'A': 2, 'B': 1}}
+
+    def test_calculate_statistik_skala(self, fragebogen_service):
+        """Test average, range and distribution for skala questions."""
+        stats = fragebogen_service._calculate_frage_statistik(
+            'skala', [4, '5', 4, 2, 'x']
+        )
+        assert stats == {
+            'typ': 'skala',
+            'durchschnitt': 3.75,
+            'min': 2,
+            'max': 5,
+            'verteilung': {'2': 1, '4': 2, '5': 1},
+        }
+        assert fragebogen_service._calculate_frage_statistik('skala', []) == {}
+
+    def test_calculate_statistik_skala_coercion(self, fragebogen_service):
+        """Test skala values: negatives and integral floats count, others not."""
+        stats = fragebogen_service._calculate_frage_statistik(
+            'skala', [-2, '-1', 3.0, ' 3 ', 2.5, True, None, ['1']]
+        )
+        assert stats['verteilung'] == {'-2': 1, '-1': 1, '3': 2}
+        assert stats['min'] == -2
+        assert stats['durchschnitt'] == 0.75
+        assert fragebogen_service._calculate_frage_statistik('skala', ['x', False]) == {}
+
 
 # =============================================================================
 # PUBLIC ROUTE TESTS
@@ -0,0 +1,273 @@
+"""Tests for the Hero plugin."""
+
+import pytest
+from flask import Blueprint, Flask, get_flashed_messages
+
+from v_flask import VFlask, db
+from v_flask_plugins.hero.models import (
+    HeroAssignment, HeroSection, HeroTemplate, PageRoute
+)
+from v_flask_plugins.hero.services.hero_service import HeroService
+from v_flask_plugins.hero.services.route_sync_service import RouteSyncService
+# Hero models reference the media plugin's Media model
+from v_flask_plugins.media.models import Media
+
+
+def create_public_blueprint():
+    """Create a public blueprint whose pages can get hero sections."""
+    public_bp = Blueprint('public', __name__)
+
+    @public_bp.route('/')
+    def index():
+        return 'Startseite'
+
+    @public_bp.route('/kontakt')
+    def kontakt():
+        return 'Kontakt'
+
+    @public_bp.route('/artikel/<int:artikel_id>')
+    def artikel(artikel_id):
+        return 'Artikel'
+
+    return public_bp
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def app_with_hero():
+    """Create a test Flask application with the hero plugin."""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SECRET_KEY'] = 'test-secret-key'
+
+    VFlask(app)
+
+    from v_flask_plugins.hero.routes import hero_admin_bp
+    app.register_blueprint(hero_admin_bp, url_prefix='/admin/hero')
+    app.register_blueprint(create_public_blueprint())
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture
+def hero_template(app_with_hero):
+    """Create a hero text template."""
+    with app_with_hero.app_context():
+        template = HeroTemplate(
+            slug='standard', name='Standard', titel='Willkommen', untertitel='Untertitel'
+        )
+        db.session.add(template)
+        db.session.commit()
+        yield template
+
+
+@pytest.fixture
+def hero(app_with_hero, hero_template):
+    """Create an active hero section using the template."""
+    with app_with_hero.app_context():
+        hero = HeroSection(name='Startseite', template_id=hero_template.id, active=True)
+        db.session.add(hero)
+        db.session.commit()
+        yield hero
+
+
+@pytest.fixture
+def page_routes(app_with_hero):
+    """Create assignable page routes."""
+    with app_with_hero.app_context():
+        routes = [
+            PageRoute(
+                endpoint=f'public.seite{i}',
+                rule=f'/seite{i}',
+                blueprint='public',
+                display_name=f'Seite {i}',
+                route_type='page',
+                hero_assignable=True
+            )
+            for i in range(3)
+        ]
+        routes.append(PageRoute(
+            endpoint='shop.liste',
+            rule='/shop',
+            blueprint='shop',
+            display_name='Shop',
+            route_type='page',
+            hero_assignable=False
+        ))
+        db.session.add_all(routes)
+        db.session.commit()
+        yield routes
+
+
+def unwrapped(view):
+    """Get an admin view without its admin_required wrapper."""
+    return getattr(view, '__wrapped__', view)
+
+
+# =============================================================================
+# RENDERING TESTS
+# =============================================================================
+
+class TestHeroRendering:
+    """Tests for HeroService rendering and its render cache."""
+
+    def test_render_hero_reflects_edits(self, app_with_hero, hero):
+        """Test that editing a hero (or its template) changes the cached output."""
+        service = HeroService()
+        with app_with_hero.test_request_context():
+            h = db.session.get(HeroSection, hero.id)
+            html = service.render_hero(h)
+            assert 'Willkommen' in html
+            assert service.render_hero(h) is html
+
+            h.custom_title = 'Neuer Titel'
+            db.session.commit()
+            html = service.render_hero(h)
+            assert 'Neuer Titel' in html
+            assert 'Willkommen' not in html
+
+            h.custom_title = None
+            h.template.titel = 'Template geändert'
+            db.session.commit()
+            assert 'Template geändert' in service.render_hero(h)
+
+    def test_render_hero_reflects_replaced_media(self, app_with_hero, hero):
+        """Test that a replaced image behind the same media record is re-rendered."""
+        service = HeroService()
+        with app_with_hero.test_request_context():
+            media = Media(
+                filename='alt.jpg',
+                original_filename='alt.jpg',
+                storage_path='2026/alt.jpg',
+                mime_type='image/jpeg',
+                path_large='2026/alt_large.jpg'
+            )
+            db.session.add(media)
+            db.session.flush()
+            h = db.session.get(HeroSection, hero.id)
+            h.media_id = media.id
+            db.session.commit()
+            assert '/media/2026/alt_large.jpg' in service.render_hero(h)
+
+            media.path_large = '2026/neu_large.jpg'
+            db.session.commit()
+            assert '/media/2026/neu_large.jpg' in service.render_hero(h)
+
+    def test_render_cache_is_bounded_lru(self, app_with_hero, hero_template):
+        """Test the render cache evicts the least recently used entry only."""
+        service = HeroService()
+        service.RENDER_CACHE_SIZE = 2
+        with app_with_hero.test_request_context():
+            heroes = [
+                HeroSection(name=f'Hero {i}', custom_title=f'Titel {i}')
+                for i in range(3)
+            ]
+            db.session.add_all(heroes)
+            db.session.commit()
+
+            first = service.render_hero(heroes[0])
+            service.render_hero(heroes[1])
+            assert service.render_hero(heroes[0]) is first
+            service.render_hero(heroes[2])
+
+            assert len(service._render_cache) == 2
+            assert service.render_hero(heroes[0]) is first
+            assert [key[0] for key in service._render_cache] == [heroes[2].id, heroes[0].id]
+
+
+# =============================================================================
+# ADMIN ROUTE TESTS
+# =============================================================================
+
+class TestHeroTemplateAdmin:
+    """Tests for the hero template admin views."""
+
+    def test_delete_template_in_use_is_refused(self, app_with_hero, hero, hero_template):
+        """Test the guarded delete keeps a template used by a hero section."""
+        from v_flask_plugins.hero.routes import delete_template
+        with app_with_hero.test_request_context(method='POST'):
+            unwrapped(delete_template)(hero_template.id)
+
+            assert db.session.get(HeroTemplate, hero_template.id) is not None
+            assert 'kann nicht gelöscht werden' in get_flashed_messages()[0]
+
+    def test_delete_template_unused(self, app_with_hero, hero_template):
+        """Test an unused template is deleted."""
+        from v_flask_plugins.hero.routes import delete_template
+        with app_with_hero.test_request_context(method='POST'):
+            unwrapped(delete_template)(hero_template.id)
+
+            assert db.session.get(HeroTemplate, hero_template.id) is None
+            assert get_flashed_messages() == ['Template gelöscht.']
+
+
+# =============================================================================
+# ROUTE SYNC TESTS
+# =============================================================================
+
+class TestRouteSyncService:
+    """Tests for RouteSyncService."""
+
+    def test_get_unassigned_routes(self, app_with_hero, hero, page_routes):
+        """Test the anti-join matches assignable routes minus the hero's routes."""
+        service = RouteSyncService()
+        with app_with_hero.test_request_context():
+            db.session.add(HeroAssignment(
+                hero_section_id=hero.id, page_route_id=page_routes[1].id
+            ))
+            # Assignment of another hero must not hide the route
+            other = HeroSection(name='Andere', custom_title='Andere')
+            db.session.add(other)
+            db.session.flush()
+            db.session.add(HeroAssignment(
+                hero_section_id=other.id, page_route_id=page_routes[2].id
+            ))
+            db.session.commit()
+
+            assigned = {page_routes[1].id}
+            expected = [
+                r.id for r in service.get_assignable_routes() if r.id not in assigned
+            ]
+            unassigned = [r.id for r in service.get_unassigned_routes(hero.id)]
+
+            assert unassigned == expected
+            assert unassigned == [page_routes[0].id, page_routes[2].id]
+
+    def test_sync_routes(self, app_with_hero, hero):
+        """Test sync inserts, updates and deletes PageRoute rows across runs."""
+        service = RouteSyncService()
+        with app_with_hero.app_context():
+            stats = service.sync_routes(app_with_hero)
+
+            assert stats == {'added': 3, 'removed': 0, 'unchanged': 0}
+            routes = {r.endpoint: r for r in PageRoute.query.all()}
+            assert set(routes) == {'public.index', 'public.kontakt', 'public.artikel'}
+            assert routes['public.index'].display_name == 'Startseite'
+            assert routes['public.artikel'].display_name == 'Artikel (Artikel_Id)'
+            assert routes['public.kontakt'].route_type == 'page'
+            assert routes['public.kontakt'].hero_assignable is True
+            assert routes['public.kontakt'].created_at is not None
+
+            # Simulate a changed rule and a route that no longer exists
+            routes['public.kontakt'].rule = '/alt'
+            stale = PageRoute(endpoint='public.alt', rule='/weg', blueprint='public')
+            db.session.add(stale)
+            db.session.flush()
+            db.session.add(HeroAssignment(hero_section_id=hero.id, page_route_id=stale.id))
+            db.session.commit()
+
+            stats = service.sync_routes(app_with_hero)
+            db.session.expire_all()
+
+            assert stats == {'added': 0, 'removed': 1, 'unchanged': 3}
+            assert PageRoute.query.filter_by(endpoint='public.kontakt').one().rule == '/kontakt'
+            assert PageRoute.query.filter_by(endpoint='public.alt').first() is None
+            assert HeroAssignment.query.count() == 0